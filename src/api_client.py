@@ -6,14 +6,14 @@ Bu modül dosya yükleme ve işleme API çağrılarını yönetir.
 
 import requests
 from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+from typing import AbstractSet, Dict, Any, List, Tuple, Optional
 from pathlib import Path
 
 
 class APIClient:
     """API işlemlerini yöneten sınıf."""
 
-    def __init__(self, api_base_url: str, supported_formats: set):
+    def __init__(self, api_base_url: str, supported_formats: AbstractSet[str]):
         """
         APIClient'ı başlat.
 
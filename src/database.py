@@ -6,28 +6,74 @@ Bu modül SQLite veritabanı işlemlerini yönetir.
 
 import sqlite3
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple, Optional, Union
+from typing import List, Dict, Any, Tuple, Optional, Union, Sequence
 from pathlib import Path
 
 
 class DatabaseManager:
     """Veritabanı işlemlerini yöneten sınıf."""
 
-    def __init__(self, db_path: str = "upload_logs.db"):
+    # get_filtered_logs tarafından döndürülebilecek kolonlar (varsayılan sıra)
+    _LOG_COLUMNS = (
+        "filename",
+        "file_extension",
+        "file_size",
+        "user_name",
+        "selection_time",
+        "upload_end_time",
+        "upload_duration_seconds",
+        "processing_end_time",
+        "processing_duration_seconds",
+        "upload_status",
+        "processing_status",
+        "is_duplicate",
+        "upload_error_message",
+        "processing_error_message",
+        "overwrite_count",
+        "last_duplicate_time",
+    )
+
+    def __init__(self, db_path: str = "upload_logs.db", uri: bool = False):
         """
         DatabaseManager'ı başlat.
 
         Args:
-            db_path: Veritabanı dosya yolu
+            db_path: Veritabanı dosya yolu; ":memory:" verilirse veritabanı
+                yalnızca bellekte tutulur
+            uri: db_path bir SQLite URI'si mi
+                (ör. "file:test?mode=memory&cache=shared")
         """
+        if db_path == ":memory:":
+            # Her metot yeni bağlantı açtığından bellek içi veritabanı
+            # paylaşımlı önbellekle adlandırılır
+            db_path = f"file:memdb_{id(self)}?mode=memory&cache=shared"
+            uri = True
         self.db_path = db_path
+        self.uri = uri
+        self._in_memory = uri and (":memory:" in db_path or "mode=memory" in db_path)
+        # Bellek içi veritabanı son bağlantı kapanınca silinir; biri açık tutulur
+        self._keepalive = None
+        if self._in_memory:
+            self._keepalive = sqlite3.connect(db_path, uri=True)
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Veritabanına yeni bir bağlantı aç."""
+        conn = sqlite3.connect(self.db_path, uri=self.uri)
+        if not self._in_memory:
+            # WAL modunda her commit'te fsync gerekmez
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def init_database(self) -> None:
         """SQLite veritabanını başlat - geliştirilmiş loglama."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
+        # WAL kalıcıdır; okuyucular yazarları beklemez ve commit'ler ucuzlar
+        if not self._in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+
         # Ana log tablosu
         cursor.execute(
             """
@@ -104,6 +150,48 @@ class DatabaseManager:
         self._add_column_if_not_exists(cursor, "overwrite_count", "INTEGER DEFAULT 0")
         self._add_column_if_not_exists(cursor, "last_duplicate_time", "TIMESTAMP NULL")
 
+        # Filtre sorguları için indeks
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_filters
+            ON upload_logs (user_name, upload_status, processing_status)
+        """
+        )
+
+        # Özet istatistiklerinin gruplamaları için indeksler
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_status
+            ON upload_logs (upload_status, processing_status)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_extension
+            ON upload_logs (file_extension)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_selection_date
+            ON upload_logs (DATE(selection_time))
+        """
+        )
+
+        # Sıralama kolonları için indeksler
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_selection_time
+            ON upload_logs (selection_time)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_upload_logs_file_size
+            ON upload_logs (file_size)
+        """
+        )
+
         conn.commit()
         conn.close()
 
@@ -143,7 +231,7 @@ class DatabaseManager:
         Returns:
             Kaydedilen kaydın ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         file_extension = Path(filename).suffix.lower()
@@ -171,6 +259,52 @@ class DatabaseManager:
         conn.close()
         return file_id
 
+    def log_file_selection_many(self, rows: List[Tuple]) -> None:
+        """
+        Birden fazla dosya seçimini tek transaction'da kaydet.
+
+        Args:
+            rows: (filename, file_hash, file_size, user_name, original_path,
+                local_path, is_duplicate) tuple'ları
+        """
+        if not rows:
+            return
+
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+            INSERT INTO upload_logs 
+            (filename, file_hash, file_size, file_extension, user_name, original_path, local_path, is_duplicate)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                (
+                    filename,
+                    file_hash,
+                    file_size,
+                    Path(filename).suffix.lower(),
+                    user_name,
+                    original_path,
+                    local_path,
+                    is_duplicate,
+                )
+                for (
+                    filename,
+                    file_hash,
+                    file_size,
+                    user_name,
+                    original_path,
+                    local_path,
+                    is_duplicate,
+                ) in rows
+            ],
+        )
+
+        conn.commit()
+        conn.close()
+
     def log_api_operation(
         self,
         operation_type: str,
@@ -190,7 +324,7 @@ class DatabaseManager:
         Returns:
             Kaydedilen kaydın ID'si
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -229,7 +363,7 @@ class DatabaseManager:
             error_count: Hatalı sayısı
             error_message: Hata mesajı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         end_time = datetime.now().isoformat()
@@ -275,7 +409,7 @@ class DatabaseManager:
             error_message: Hata mesajı
             start_time: Başlangıç zamanı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         current_time = datetime.now().isoformat()
@@ -348,7 +482,7 @@ class DatabaseManager:
             status: Durum
             error_message: Hata mesajı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         current_time = datetime.now().isoformat()
@@ -396,7 +530,7 @@ class DatabaseManager:
         Returns:
             Duplicate olup olmadığı
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -417,7 +551,7 @@ class DatabaseManager:
         Returns:
             Duplicate bilgileri veya None
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -451,51 +585,89 @@ class DatabaseManager:
             filename: Dosya adı
             is_overwrite: Overwrite işlemi mi
         """
-        conn = sqlite3.connect(self.db_path)
+        self.update_duplicate_info_many([filename], is_overwrite)
+
+    def update_duplicate_info_many(
+        self, filenames: List[str], is_overwrite: bool = False
+    ) -> None:
+        """
+        Birden fazla dosyanın duplicate bilgilerini tek transaction'da güncelle.
+
+        Args:
+            filenames: Dosya adları
+            is_overwrite: Overwrite işlemi mi
+        """
+        if not filenames:
+            return
+
+        conn = self._connect()
         cursor = conn.cursor()
         current_time = datetime.now().isoformat()
+        params = [(current_time, filename) for filename in filenames]
 
         if is_overwrite:
             # Overwrite sayacını artır
-            cursor.execute(
+            cursor.executemany(
                 """
                 UPDATE upload_logs 
                 SET overwrite_count = overwrite_count + 1, 
                     last_duplicate_time = ?
                 WHERE filename = ?
                 """,
-                (current_time, filename),
+                params,
             )
         else:
             # Sadece duplicate zamanını güncelle
-            cursor.execute(
+            cursor.executemany(
                 """
                 UPDATE upload_logs 
                 SET last_duplicate_time = ?
                 WHERE filename = ?
                 """,
-                (current_time, filename),
+                params,
             )
 
         conn.commit()
         conn.close()
 
-    def get_filtered_logs(self, filters: Dict[str, Any]) -> List[Tuple]:
+    def get_filtered_logs(
+        self,
+        filters: Dict[str, Any],
+        columns: Optional[Sequence[str]] = None,
+        order_by: str = "selection_time",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Tuple]:
         """
         Filtrelenmiş logları getir.
 
         Args:
             filters: Filtre kriterleri
+            columns: Döndürülecek kolonlar, verilen sırayla (varsayılan: tüm log kolonları)
+            order_by: Sıralama kolonu
+            descending: Azalan sıralama yapılıp yapılmayacağı
+            limit: En fazla döndürülecek kayıt sayısı (varsayılan: sınırsız)
+            offset: Atlanacak kayıt sayısı (limit ile birlikte kullanılır)
 
         Returns:
             Filtrelenmiş log kayıtları
+
+        Raises:
+            ValueError: Bilinmeyen bir kolon istenirse
         """
-        base_query = """
-            SELECT filename, file_extension, file_size, user_name, selection_time, 
-                   upload_end_time, upload_duration_seconds, processing_end_time, 
-                   processing_duration_seconds, upload_status, processing_status, 
-                   is_duplicate, upload_error_message, processing_error_message,
-                   overwrite_count, last_duplicate_time
+        if columns is None:
+            columns = self._LOG_COLUMNS
+        else:
+            unknown = [col for col in columns if col not in self._LOG_COLUMNS]
+            if unknown:
+                raise ValueError(f"Bilinmeyen log kolonu: {', '.join(unknown)}")
+        # Kolon adı sorguya doğrudan yazıldığı için beyaz listeden kontrol edilir
+        if order_by not in self._LOG_COLUMNS:
+            raise ValueError(f"Bilinmeyen log kolonu: {order_by}")
+
+        base_query = f"""
+            SELECT {', '.join(columns)}
             FROM upload_logs 
             WHERE 1=1
         """
@@ -550,9 +722,12 @@ class DatabaseManager:
         if conditions:
             base_query += " AND " + " AND ".join(conditions)
 
-        base_query += " ORDER BY selection_time DESC"
+        base_query += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            base_query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute(base_query, params)
         results = cursor.fetchall()
@@ -562,7 +737,7 @@ class DatabaseManager:
 
     def get_user_list(self) -> List[str]:
         """Kullanıcı listesini getir."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("SELECT DISTINCT user_name FROM upload_logs ORDER BY user_name")
         users = [row[0] for row in cursor.fetchall()]
@@ -571,7 +746,7 @@ class DatabaseManager:
 
     def get_api_stats(self) -> List[Tuple]:
         """API istatistiklerini getir."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute(
@@ -587,104 +762,105 @@ class DatabaseManager:
         return results
 
     def get_summary_stats(self) -> Dict[str, Any]:
-        """Özet istatistikleri getir."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """
+        Özet istatistikleri getir.
 
-        stats = {}
+        Tüm bölümler tek bir sorguda, etiketli UNION ALL alt sorgularıyla
+        hesaplanır ve satırlar Python tarafında bölümlere dağıtılır.
 
-        # Toplam dosya sayısı
-        cursor.execute("SELECT COUNT(*) FROM upload_logs")
-        stats["total_files"] = cursor.fetchone()[0]
+        Returns:
+            total_files, status_counts, user_stats, format_stats, daily_stats
+            ve daily_max (en yoğun günün kayıt sayısı) anahtarlarını içeren
+            sözlük
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
 
-        # Durum bazlı sayılar
+        # Her satır: (bölüm, anahtar, anahtar2, değer1, değer2, değer3, değer4)
         cursor.execute(
             """
-            SELECT 
-                upload_status,
-                processing_status,
-                COUNT(*) as count
+            SELECT 'status', upload_status, processing_status, COUNT(*),
+                   SUM(CASE WHEN is_duplicate = 1 THEN 1 ELSE 0 END), NULL, NULL
             FROM upload_logs
             GROUP BY upload_status, processing_status
-        """
-        )
-
-        status_counts = {}
-        for upload_status, processing_status, count in cursor.fetchall():
-            if processing_status == "completed":
-                status_counts["processed"] = status_counts.get("processed", 0) + count
-            elif processing_status == "failed":
-                status_counts["proc_failed"] = (
-                    status_counts.get("proc_failed", 0) + count
-                )
-            elif upload_status == "uploaded":
-                status_counts["uploaded"] = status_counts.get("uploaded", 0) + count
-            elif upload_status == "upload_failed":
-                status_counts["upload_failed"] = (
-                    status_counts.get("upload_failed", 0) + count
-                )
-            else:
-                status_counts["selected"] = status_counts.get("selected", 0) + count
-
-        # Duplicate sayısı
-        cursor.execute("SELECT COUNT(*) FROM upload_logs WHERE is_duplicate = 1")
-        status_counts["duplicates"] = cursor.fetchone()[0]
-
-        stats["status_counts"] = status_counts
-
-        # Kullanıcı bazlı istatistikler
-        cursor.execute(
-            """
-            SELECT 
-                user_name,
-                COUNT(*) as total,
-                SUM(CASE WHEN processing_status = 'completed' THEN 1 ELSE 0 END) as processed,
-                SUM(file_size) as total_size
+            UNION ALL
+            SELECT 'user', user_name, NULL, COUNT(*),
+                   SUM(CASE WHEN processing_status = 'completed' THEN 1 ELSE 0 END),
+                   SUM(file_size), NULL
             FROM upload_logs
             GROUP BY user_name
-            ORDER BY total DESC
-        """
-        )
-        stats["user_stats"] = cursor.fetchall()
-
-        # Format bazlı istatistikler
-        cursor.execute(
-            """
-            SELECT 
-                file_extension,
-                COUNT(*) as count,
-                SUM(file_size) as total_size,
-                AVG(upload_duration_seconds) as avg_upload_time,
-                AVG(processing_duration_seconds) as avg_processing_time
+            UNION ALL
+            SELECT 'format', file_extension, NULL, COUNT(*), SUM(file_size),
+                   AVG(upload_duration_seconds), AVG(processing_duration_seconds)
             FROM upload_logs
             WHERE file_extension IS NOT NULL AND file_extension != ''
             GROUP BY file_extension
-            ORDER BY count DESC
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'daily', DATE(selection_time) AS date, NULL, COUNT(*),
+                       NULL, NULL, NULL
+                FROM upload_logs
+                WHERE selection_time IS NOT NULL
+                GROUP BY DATE(selection_time)
+                ORDER BY date DESC
+                LIMIT 30
+            )
         """
         )
-        stats["format_stats"] = cursor.fetchall()
 
-        # Zaman bazlı istatistikler
-        cursor.execute(
-            """
-            SELECT 
-                DATE(selection_time) as date,
-                COUNT(*) as count
-            FROM upload_logs
-            WHERE selection_time IS NOT NULL
-            GROUP BY DATE(selection_time)
-            ORDER BY date DESC
-            LIMIT 30
-        """
-        )
-        stats["daily_stats"] = cursor.fetchall()
+        total_files = 0
+        status_counts = {}
+        duplicates = 0
+        user_stats = []
+        format_stats = []
+        daily_stats = []
+        daily_max = 1
+
+        for section, key, key2, value1, value2, value3, value4 in cursor.fetchall():
+            if section == "status":
+                total_files += value1
+                duplicates += value2
+                if key2 == "completed":
+                    label = "processed"
+                elif key2 == "failed":
+                    label = "proc_failed"
+                elif key == "uploaded":
+                    label = "uploaded"
+                elif key == "upload_failed":
+                    label = "upload_failed"
+                else:
+                    label = "selected"
+                status_counts[label] = status_counts.get(label, 0) + value1
+            elif section == "user":
+                user_stats.append((key, value1, value2, value3))
+            elif section == "format":
+                format_stats.append((key, value1, value2, value3, value4))
+            else:
+                daily_stats.append((key, value1))
+                if value1 > daily_max:
+                    daily_max = value1
 
         conn.close()
-        return stats
+
+        status_counts["duplicates"] = duplicates
+
+        # UNION ALL bölümlerin kendi sıralamasını garanti etmez
+        user_stats.sort(key=lambda row: row[1], reverse=True)
+        format_stats.sort(key=lambda row: row[1], reverse=True)
+        daily_stats.sort(key=lambda row: row[0], reverse=True)
+
+        return {
+            "total_files": total_files,
+            "status_counts": status_counts,
+            "user_stats": user_stats,
+            "format_stats": format_stats,
+            "daily_stats": daily_stats,
+            "daily_max": daily_max,
+        }
 
     def clear_logs(self) -> None:
         """Tüm logları temizle."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM upload_logs")
         cursor.execute("DELETE FROM api_stats")
@@ -695,7 +871,7 @@ class DatabaseManager:
         self, status: str, error_message: Optional[str] = None
     ) -> None:
         """Toplu upload durumu güncelle."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         if status == "uploaded":
@@ -7,13 +7,45 @@ Bu modül dosya seçimi, kopyalama, hash hesaplama ve duplicate kontrolü işlem
 import hashlib
 import shutil
 from pathlib import Path
-from typing import List, Tuple, Set, Optional, Union
+from typing import AbstractSet, List, Tuple, Optional, Union
+
+
+# Aşağıdaki fonksiyonlar pickle edilebilir; run_cpu_thread ile süreçte çalışabilir
+def compute_file_hash(filepath: str) -> str:
+    """
+    Dosyanın MD5 hash'ini hesapla.
+
+    Args:
+        filepath: Dosya yolu
+
+    Returns:
+        MD5 hash değeri
+    """
+    hash_md5 = hashlib.md5()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(4096), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def compute_file_info(filepath: str) -> Tuple[str, int, str]:
+    """
+    Dosya bilgilerini hesapla.
+
+    Args:
+        filepath: Dosya yolu
+
+    Returns:
+        (Dosya adı, Boyut, Hash)
+    """
+    path = Path(filepath)
+    return path.name, path.stat().st_size, compute_file_hash(filepath)
 
 
 class FileManager:
     """Dosya işlemlerini yöneten sınıf."""
 
-    def __init__(self, local_storage_dir: str, supported_formats: Set[str]):
+    def __init__(self, local_storage_dir: str, supported_formats: AbstractSet[str]):
         """
         FileManager'ı başlat.
 
@@ -35,11 +67,7 @@ class FileManager:
         Returns:
             MD5 hash değeri
         """
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        return compute_file_hash(filepath)
 
     def check_duplicate_by_name(self, filename: str) -> Tuple[bool, str]:
         """
@@ -177,8 +205,4 @@ class FileManager:
         Returns:
             (Dosya adı, Boyut, Hash)
         """
-        path = Path(filepath)
-        filename = path.name
-        file_size = path.stat().st_size
-        file_hash = self.calculate_file_hash(filepath)
-        return filename, file_size, file_hash
+        return compute_file_info(filepath)
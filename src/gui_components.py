@@ -14,6 +14,21 @@ from pathlib import Path
 class GUIComponents:
     """GUI bileşenlerini yöneten sınıf."""
 
+    # Log tablosunun görüntülenen kolonları
+    _LOG_COLUMNS = (
+        "Dosya",
+        "Format",
+        "Boyut",
+        "Kullanıcı",
+        "Seçim",
+        "Yükleme",
+        "Y.Süre",
+        "İşleme",
+        "İ.Süre",
+        "Durum",
+        "Hata",
+    )
+
     def __init__(
         self,
         root: tk.Tk,
@@ -253,19 +268,7 @@ class GUIComponents:
         tree_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Treeview ve scrollbar - genişletilmiş kolonlar
-        columns = (
-            "Dosya",
-            "Format",
-            "Boyut",
-            "Kullanıcı",
-            "Seçim",
-            "Yükleme",
-            "Y.Süre",
-            "İşleme",
-            "İ.Süre",
-            "Durum",
-            "Hata",
-        )
+        columns = self._LOG_COLUMNS
         self.tree = ttk.Treeview(
             tree_frame, columns=columns, show="headings", height=15
         )
@@ -799,9 +802,12 @@ class GUIComponents:
             values = self.tree.item(child)["values"]
             data.append((child, values))
 
+        columns = self._LOG_COLUMNS
+        col_idx = columns.index(col)
+
         # Sıralama fonksiyonu
         def sort_key(item):
-            value = item[1][columns.index(col)]
+            value = item[1][col_idx]
             # Sayısal değerler için özel işleme
             if col in ["Boyut", "Y.Süre", "İ.Süre"]:
                 try:
@@ -840,19 +846,6 @@ class GUIComponents:
             self.tree.move(child, "", index)
 
         # Kolon başlığını güncelle
-        columns = (
-            "Dosya",
-            "Format",
-            "Boyut",
-            "Kullanıcı",
-            "Seçim",
-            "Yükleme",
-            "Y.Süre",
-            "İşleme",
-            "İ.Süre",
-            "Durum",
-            "Hata",
-        )
         for c in columns:
             if c == col:
                 direction = "↓" if self.sort_reverse else "↑"
@@ -35,7 +35,7 @@ class DocumentUploadManager:
         # self.api_base_url = "http://localhost:3820"
         self.local_storage_dir = "C:/Users/Polinity/Desktop/DOCUMENTS"
         # self.local_storage_dir = Path("C:/Users/User/Desktop/DOCUMENTS")
-        self.supported_formats = {".pdf", ".docx", ".doc", ".txt", ".md"}
+        self.supported_formats = frozenset({".pdf", ".docx", ".doc", ".txt", ".md"})
 
         # Modülleri başlat
         self.database_manager = DatabaseManager()
@@ -63,10 +63,24 @@ class DocumentUploadManager:
         # GUI'yi kur
         self.gui.setup_gui()
 
+        # Pencere kapatılırken arka plan havuzu da kapatılır
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def run(self) -> None:
         """Uygulamayı çalıştır."""
         self.root.mainloop()
 
+    def on_close(self) -> None:
+        """
+        Pencere kapatıldığında kaynakları bırak.
+
+        Kuyrukta bekleyen işler iptal edilir; süren upload/process istekleri
+        daemon thread'lerde çalıştığından süreç onları beklemeden kapanır.
+        """
+        self.thread_manager.shutdown(wait=False, cancel_futures=True)
+        self.gui.shutdown()
+        self.root.destroy()
+
 
 def main() -> None:
     """Ana fonksiyon."""
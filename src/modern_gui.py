@@ -6,14 +6,208 @@ Bu modül modern ve renkli Tkinter GUI bileşenlerini yönetir.
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Callable, Optional, Union
 from pathlib import Path
 
 
+def _ts(value: Optional[str]) -> str:
+    """Zaman damgasını saniye hassasiyetine kırp ("YYYY-MM-DD HH:MM:SS")."""
+    return value[:19] if value else ""
+
+
+def _derive_status(
+    upload_status: Optional[str], processing_status: Optional[str]
+) -> str:
+    """Upload ve işleme durumlarından görüntülenecek durum etiketini türet."""
+    if processing_status == "completed":
+        return "PROCESSED"
+    elif processing_status == "failed":
+        return "PROC_FAILED"
+    elif upload_status == "uploaded":
+        return "UPLOADED"
+    elif upload_status == "upload_failed":
+        return "UP_FAILED"
+    elif upload_status == "uploading":
+        return "UPLOADING"
+    elif processing_status == "processing":
+        return "PROCESSING"
+    else:
+        return "SELECTED"
+
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    Sadece görünen satırları Tk'ya ekleyen Treeview.
+
+    Tüm veri Python listesinde tutulur; ağaçta yalnızca görünür pencere kadar
+    satır bulunur. Kaydırma çubuğu tüm veri setine göre ayarlanır, böylece
+    açılış süresi ve bellek kullanımı toplam satır sayısından bağımsızdır.
+    """
+
+    def __init__(self, master: tk.Misc, row_height: int = 25, **kwargs: Any):
+        """
+        VirtualTreeview'ı başlat.
+
+        Args:
+            master: Üst widget
+            row_height: Stilde tanımlı satır yüksekliği (piksel)
+            **kwargs: ttk.Treeview'a iletilen seçenekler
+        """
+        super().__init__(master, **kwargs)
+        self._rows: List[tuple] = []
+        self._first_visible = 0
+        self._visible_count = int(kwargs.get("height", 10))
+        self._row_height = row_height
+        self._scrollbar: Optional[ttk.Scrollbar] = None
+
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.bind("<Button-5>", lambda e: self._scroll_by(3))
+
+    def attach_scrollbar(self, scrollbar: ttk.Scrollbar) -> None:
+        """
+        Dikey kaydırma çubuğunu sanal görünüme bağla.
+
+        Args:
+            scrollbar: Dikey kaydırma çubuğu
+        """
+        self._scrollbar = scrollbar
+        scrollbar.configure(command=self.yview)
+        self._update_scrollbar()
+
+    def set_rows(self, rows: List[tuple]) -> None:
+        """
+        Gösterilecek tüm satırları ayarla ve ilk pencereyi çiz.
+
+        Args:
+            rows: Satır değerleri listesi
+        """
+        self._rows = list(rows)
+        self._first_visible = 0
+        self._render()
+
+    def yview(self, *args: Any) -> Any:
+        """Kaydırma çubuğu komutlarını tüm veri setine göre uygula."""
+        if not args:
+            return self._fraction()
+
+        total = len(self._rows)
+        if args[0] == "moveto":
+            first = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._visible_count if args[2] == "pages" else 1
+            first = self._first_visible + int(args[1]) * step
+        else:
+            return None
+        self._scroll_to(first)
+        return None
+
+    def _fraction(self) -> tuple:
+        """Görünür pencerenin tüm veri içindeki oranını döndür."""
+        total = len(self._rows)
+        if not total:
+            return 0.0, 1.0
+        first = self._first_visible / total
+        last = min(1.0, (self._first_visible + self._visible_count) / total)
+        return first, last
+
+    def _scroll_by(self, amount: int) -> str:
+        """Görünümü verilen satır sayısı kadar kaydır."""
+        self._scroll_to(self._first_visible + amount)
+        return "break"
+
+    def _scroll_to(self, first: int) -> None:
+        """İlk görünen satırı sınırlar içinde ayarla ve gerekirse yeniden çiz."""
+        first = max(0, min(first, len(self._rows) - self._visible_count))
+        if first != self._first_visible:
+            self._first_visible = first
+            self._render()
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        """Fare tekerleği ile kaydır (Windows/macOS)."""
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Yükseklik değiştiğinde görünür satır sayısını yeniden hesapla."""
+        # Başlık satırı da bir satır yüksekliği kaplar
+        visible = max(1, event.height // self._row_height - 1)
+        if visible != self._visible_count:
+            self._visible_count = visible
+            self._first_visible = max(
+                0, min(self._first_visible, len(self._rows) - visible)
+            )
+            self._render()
+
+    def _render(self) -> None:
+        """Ağaçtaki satırları görünür pencereyle değiştir."""
+        children = self.get_children()
+        if children:
+            self.delete(*children)
+
+        insert = self.insert
+        first = self._first_visible
+        for values in self._rows[first : first + self._visible_count]:
+            insert("", "end", values=values)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        """Kaydırma çubuğunu tüm veri setine göre güncelle."""
+        if self._scrollbar is not None:
+            self._scrollbar.set(*self._fraction())
+
+
 class ModernGUIComponents:
     """Modern GUI bileşenlerini yöneten sınıf."""
 
+    # Log tablosunun görüntülenen kolonları
+    _LOG_COLUMNS = (
+        "Dosya",
+        "Format",
+        "Boyut",
+        "Kullanıcı",
+        "Seçim",
+        "Durum",
+        "Overwrite",
+        "Hata",
+    )
+
+    # Veritabanında sıralanabilen kolonlar; diğerleri Python'da sıralanır
+    _SQL_SORT_COLUMNS = {
+        "Dosya": "filename",
+        "Format": "file_extension",
+        "Boyut": "file_size",
+        "Kullanıcı": "user_name",
+        "Seçim": "selection_time",
+    }
+
+    # (upload_status, processing_status) -> durum etiketi, bilinen tüm kombinasyonlar
+    _STATUS_MAP = {
+        (upload_status, processing_status): _derive_status(
+            upload_status, processing_status
+        )
+        for upload_status in ("selected", "uploading", "uploaded", "upload_failed")
+        for processing_status in ("not_processed", "processing", "completed", "failed")
+    }
+
+    # Log tablosu için veritabanından istenen kolonlar
+    _LOG_QUERY_COLUMNS = (
+        "filename",
+        "file_extension",
+        "file_size",
+        "user_name",
+        "selection_time",
+        "upload_status",
+        "processing_status",
+        "is_duplicate",
+        "upload_error_message",
+        "processing_error_message",
+        "overwrite_count",
+        "last_duplicate_time",
+    )
+
     def __init__(
         self,
         root: tk.Tk,
@@ -41,6 +235,18 @@ class ModernGUIComponents:
         self.report_generator = report_generator
         self.thread_manager = thread_manager
 
+        # Desteklenen formatların gösterim metni ve filtre değerleri bir kez hazırlanır
+        self._supported = frozenset(file_manager.supported_formats)
+        self._supported_joined = ", ".join(sorted(self._supported))
+        self._filetypes = [
+            ("Desteklenen Dosyalar", "*.pdf;*.docx;*.doc;*.txt;*.md"),
+            ("PDF", "*.pdf"),
+            ("Word", "*.docx;*.doc"),
+            ("Text", "*.txt"),
+            ("Markdown", "*.md"),
+            ("Tüm Dosyalar", "*.*"),
+        ]
+
         # Modern renk paleti - Koyu tema
         self.colors = {
             "bg_primary": "#1a1d29",  # Ana koyu arka plan
@@ -57,6 +263,22 @@ class ModernGUIComponents:
             "hover": "#363a4f",  # Hover efekti
         }
 
+        # Vurgu renklerinin açık ve koyu tonları
+        self._lighter = {
+            self.colors["accent_blue"]: "#5ca7ff",
+            self.colors["accent_purple"]: "#8b2bc7",
+            self.colors["accent_green"]: "#1ae8ba",
+            self.colors["accent_red"]: "#ff5a81",
+            self.colors["accent_orange"]: "#ff9420",
+        }
+        self._darker = {
+            self.colors["accent_blue"]: "#3783d5",
+            self.colors["accent_purple"]: "#5a079d",
+            self.colors["accent_green"]: "#05b486",
+            self.colors["accent_red"]: "#d5365b",
+            self.colors["accent_orange"]: "#c96500",
+        }
+
         # GUI değişkenleri
         self.user_name_var = tk.StringVar(value="Kullanıcı1")
         self.selected_count_var = tk.StringVar(value="Seçilen dosya: 0")
@@ -68,10 +290,14 @@ class ModernGUIComponents:
         self.upload_button = None
         self.process_button = None
         self.progress = None
+        self._progress_job = None
+        self._style = None
 
         # Sıralama durumu
         self.sort_column = None
         self.sort_reverse = False
+        # Satırları en son Python'da sıralanan kolon; satırlar yenilenince sıfırlanır
+        self._python_sorted_column = None
 
         # Seçilen dosyalar listesi
         self.selected_files = []
@@ -79,6 +305,21 @@ class ModernGUIComponents:
         # TÜMÜNÜ İŞLE modu
         self._process_all_mode = False
 
+        # Yerel dosya listesi önbelleği (dosya işlemlerinde geçersiz kılınır)
+        self._local_files_cache: List[Path] = []
+        self._local_files_dirty = True
+
+        # Bekleyen log yenilemesi (ardışık istekler tek yenilemede birleşir)
+        self._refresh_pending = False
+
+        # Rapor ve istatistik sorguları için arka plan havuzu; her DB çağrısı
+        # kendi SQLite bağlantısını açtığı için işçi thread'lerde güvenlidir
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-io")
+
+    def shutdown(self) -> None:
+        """Arka plan havuzunu kapat, bekleyen işleri iptal et."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
     def setup_gui(self) -> None:
         """Modern GUI'yi oluştur."""
         self.root.title("📄 Document Upload Manager")
@@ -96,6 +337,9 @@ class ModernGUIComponents:
         main_container.grid_rowconfigure(3, weight=0)  # Alt panel
         main_container.grid_columnconfigure(0, weight=1)
 
+        # Stiller tüm panellerden önce bir kez yapılandırılır
+        self._configure_styles()
+
         # Üst panel
         self._create_header_panel(main_container)
 
@@ -108,9 +352,65 @@ class ModernGUIComponents:
         # Alt panel
         self._create_action_panel(main_container)
 
-        # İlk yükleme
-        self.refresh_logs()
-        self.update_user_filter()
+        # İlk yükleme pencere çizildikten sonra yapılır
+        self._schedule_refresh()
+        self.root.after_idle(self.update_user_filter)
+
+    def _configure_styles(self) -> None:
+        """Özel ttk stillerini tek seferde yapılandır."""
+        self._style = ttk.Style()
+        self._style.theme_use("default")
+
+        # Combobox
+        self._style.configure(
+            "Modern.TCombobox",
+            fieldbackground=self.colors["bg_secondary"],
+            background=self.colors["bg_secondary"],
+            foreground=self.colors["text_primary"],
+            arrowcolor=self.colors["text_primary"],
+            borderwidth=0,
+            relief="flat",
+        )
+        self._style.map(
+            "Modern.TCombobox",
+            fieldbackground=[("readonly", self.colors["bg_secondary"])],
+            selectbackground=[("readonly", self.colors["accent_blue"])],
+            selectforeground=[("readonly", self.colors["text_primary"])],
+            background=[("readonly", self.colors["bg_secondary"])],
+        )
+
+        # Treeview
+        self._style.configure(
+            "Modern.Treeview",
+            background=self.colors["bg_secondary"],
+            foreground=self.colors["text_primary"],
+            fieldbackground=self.colors["bg_secondary"],
+            borderwidth=0,
+            font=("Segoe UI", 9),
+            rowheight=25,
+        )
+        self._style.configure(
+            "Modern.Treeview.Heading",
+            background=self.colors["bg_card"],
+            foreground=self.colors["text_primary"],
+            borderwidth=0,
+            font=("Segoe UI", 9, "bold"),
+            relief="flat",
+        )
+        self._style.map(
+            "Modern.Treeview",
+            background=[("selected", self.colors["accent_blue"])],
+            foreground=[("selected", self.colors["text_primary"])],
+        )
+
+        # Progress bar
+        self._style.configure(
+            "Modern.Horizontal.TProgressbar",
+            background=self.colors["accent_blue"],
+            troughcolor=self.colors["bg_secondary"],
+            borderwidth=0,
+            thickness=4,
+        )
 
     def _create_header_panel(self, parent: tk.Frame) -> None:
         """Header panelini oluştur."""
@@ -249,7 +549,7 @@ class ModernGUIComponents:
             2,
         )
 
-        format_values = ["Tümü"] + list(self.file_manager.supported_formats)
+        format_values = ["Tümü"] + sorted(self._supported)
         self._create_compact_filter(
             content, "📄 Format:", format_values, "format_filter", 0, 3
         )
@@ -291,37 +591,13 @@ class ModernGUIComponents:
         )
         combo_frame.pack(fill=tk.X)
 
-        # Modern Style
-        style = ttk.Style()
-        style.theme_use("default")
-
-        # Combobox için özel stil
-        style_name = f"Modern{var_name}.TCombobox"
-        style.configure(
-            style_name,
-            fieldbackground=self.colors["bg_secondary"],
-            background=self.colors["bg_secondary"],
-            foreground=self.colors["text_primary"],
-            arrowcolor=self.colors["text_primary"],
-            borderwidth=0,
-            relief="flat",
-        )
-
-        style.map(
-            style_name,
-            fieldbackground=[("readonly", self.colors["bg_secondary"])],
-            selectbackground=[("readonly", self.colors["accent_blue"])],
-            selectforeground=[("readonly", self.colors["text_primary"])],
-            background=[("readonly", self.colors["bg_secondary"])],
-        )
-
         combo = ttk.Combobox(
             combo_frame,
             textvariable=var,
             values=values,
             font=("Segoe UI", 10),
             state="readonly",
-            style=style_name,
+            style="Modern.TCombobox",
         )
         combo.pack(fill=tk.X, padx=8, pady=6)
         combo.bind("<<ComboboxSelected>>", self.apply_filters)
@@ -374,43 +650,8 @@ class ModernGUIComponents:
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(0, weight=1)
 
-        # Treeview style
-        style = ttk.Style()
-        style.theme_use("default")
-        style.configure(
-            "Modern.Treeview",
-            background=self.colors["bg_secondary"],
-            foreground=self.colors["text_primary"],
-            fieldbackground=self.colors["bg_secondary"],
-            borderwidth=0,
-            font=("Segoe UI", 9),
-            rowheight=25,
-        )
-        style.configure(
-            "Modern.Treeview.Heading",
-            background=self.colors["bg_card"],
-            foreground=self.colors["text_primary"],
-            borderwidth=0,
-            font=("Segoe UI", 9, "bold"),
-            relief="flat",
-        )
-        style.map(
-            "Modern.Treeview",
-            background=[("selected", self.colors["accent_blue"])],
-            foreground=[("selected", self.colors["text_primary"])],
-        )
-
         # Treeview
-        columns = (
-            "Dosya",
-            "Format",
-            "Boyut",
-            "Kullanıcı",
-            "Seçim",
-            "Durum",
-            "Overwrite",
-            "Hata",
-        )
+        columns = self._LOG_COLUMNS
 
         self.tree = ttk.Treeview(
             tree_container,
@@ -507,17 +748,8 @@ class ModernGUIComponents:
         progress_frame = tk.Frame(content, bg=self.colors["bg_card"])
         progress_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(10, 0))
 
-        style = ttk.Style()
-        style.configure(
-            "Modern.Horizontal.TProgressbar",
-            background=self.colors["accent_blue"],
-            troughcolor=self.colors["bg_secondary"],
-            borderwidth=0,
-            thickness=4,
-        )
-
         self.progress = ttk.Progressbar(
-            progress_frame, mode="indeterminate", style="Modern.Horizontal.TProgressbar"
+            progress_frame, mode="determinate", style="Modern.Horizontal.TProgressbar"
         )
         self.progress.pack(fill=tk.X)
 
@@ -541,6 +773,8 @@ class ModernGUIComponents:
         state = kwargs.pop("state", "normal")
         text_color = kwargs.pop("text_color", self.colors["text_primary"])
 
+        hover_color = self._lighten_color(color)
+
         btn = tk.Button(
             parent,
             text=text,
@@ -548,7 +782,7 @@ class ModernGUIComponents:
             font=("Segoe UI", 10, "bold"),
             bg=color,
             fg=text_color,
-            activebackground=self._lighten_color(color),
+            activebackground=hover_color,
             activeforeground=text_color,
             relief=tk.FLAT,
             bd=0,
@@ -559,53 +793,41 @@ class ModernGUIComponents:
             width=width // 8,  # Yaklaşık pixel to char conversion
         )
 
-        def on_enter(e):
-            if btn["state"] == "normal":
-                btn.configure(bg=self._lighten_color(color))
+        # Hover renkleri widget üzerinde tutulur, handler'lar tüm butonlarda ortak
+        btn._base_bg = color
+        btn._hover_bg = hover_color
+        btn.bind("<Enter>", self._on_button_enter)
+        btn.bind("<Leave>", self._on_button_leave)
 
-        def on_leave(e):
-            if btn["state"] == "normal":
-                btn.configure(bg=color)
+        return btn
 
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+    @staticmethod
+    def _on_button_enter(event: tk.Event) -> None:
+        """Fare butonun üzerine geldiğinde hover rengini uygula."""
+        button = event.widget
+        if button["state"] == "normal":
+            button.configure(bg=button._hover_bg)
 
-        return btn
+    @staticmethod
+    def _on_button_leave(event: tk.Event) -> None:
+        """Fare butondan ayrıldığında temel rengi geri yükle."""
+        button = event.widget
+        if button["state"] == "normal":
+            button.configure(bg=button._base_bg)
 
     def _lighten_color(self, color: str) -> str:
         """Rengi açıklaştır."""
-        color_map = {
-            self.colors["accent_blue"]: "#5ca7ff",
-            self.colors["accent_purple"]: "#8b2bc7",
-            self.colors["accent_green"]: "#1ae8ba",
-            self.colors["accent_red"]: "#ff5a81",
-            self.colors["accent_orange"]: "#ff9420",
-        }
-        return color_map.get(color, color)
+        return self._lighter.get(color, color)
 
     def _darken_color(self, color: str) -> str:
         """Rengi koyulaştır."""
-        color_map = {
-            self.colors["accent_blue"]: "#3783d5",
-            self.colors["accent_purple"]: "#5a079d",
-            self.colors["accent_green"]: "#05b486",
-            self.colors["accent_red"]: "#d5365b",
-            self.colors["accent_orange"]: "#c96500",
-        }
-        return color_map.get(color, color)
+        return self._darker.get(color, color)
 
     def select_files(self) -> None:
         """Dosya seçme dialog'u."""
         filepaths = filedialog.askopenfilenames(
             title="Yüklenecek dosyaları seçin",
-            filetypes=[
-                ("Desteklenen Dosyalar", "*.pdf;*.docx;*.doc;*.txt;*.md"),
-                ("PDF", "*.pdf"),
-                ("Word", "*.docx;*.doc"),
-                ("Text", "*.txt"),
-                ("Markdown", "*.md"),
-                ("Tüm Dosyalar", "*.*"),
-            ],
+            filetypes=self._filetypes,
         )
 
         if filepaths:
@@ -622,7 +844,7 @@ class ModernGUIComponents:
             else:
                 messagebox.showinfo(
                     "Bilgi",
-                    f"Seçilen klasörde desteklenen format bulunamadı.\nDesteklenen formatlar: {', '.join(self.file_manager.supported_formats)}",
+                    f"Seçilen klasörde desteklenen format bulunamadı.\nDesteklenen formatlar: {self._supported_joined}",
                 )
 
     def process_selected_files(self, filepaths: List[str]) -> None:
@@ -635,12 +857,13 @@ class ModernGUIComponents:
         self.selected_files = []
         conflicts = []
 
+        is_supported = self.file_manager.is_supported_format
         for filepath in filepaths:
-            filename = Path(filepath).name
-
-            if not self.file_manager.is_supported_format(filepath):
+            if not is_supported(filepath):
                 continue
 
+            filename = Path(filepath).name
+
             is_duplicate, local_path = self.file_manager.check_duplicate_by_name(
                 filename
             )
@@ -650,6 +873,7 @@ class ModernGUIComponents:
             else:
                 if self.file_manager.copy_file_to_local(filepath, local_path):
                     self.selected_files.append((filepath, local_path, filename, False))
+                    self._local_files_dirty = True
 
         if conflicts:
             self.handle_file_conflicts(conflicts, user_name)
@@ -661,6 +885,8 @@ class ModernGUIComponents:
 
     def handle_file_conflicts(self, conflicts: List[tuple], user_name: str) -> None:
         """Dosya çakışmalarını çöz."""
+        overwritten = []
+
         for original_path, local_path, filename in conflicts:
             duplicate_info = self.database_manager.check_duplicate_by_name(filename)
 
@@ -685,54 +911,108 @@ class ModernGUIComponents:
                     self.selected_files.append(
                         (original_path, local_path, filename, True)
                     )
-                    # Overwrite sayısını artır
-                    self.database_manager.update_duplicate_info(
-                        filename, is_overwrite=True
-                    )
+                    self._local_files_dirty = True
+                    overwritten.append(filename)
+
+        # Overwrite sayılarını tek seferde artır
+        self.database_manager.update_duplicate_info_many(overwritten, is_overwrite=True)
 
     def save_selected_files(self, user_name: str) -> None:
         """Seçilen dosyaları veritabanına kaydet."""
-        for original_path, local_path, filename, is_duplicate in self.selected_files:
+        if not self.selected_files:
+            return
+
+        # Hash hesaplamaları paralel yapılır, kayıtlar tek seferde yazılır
+        local_paths = [local_path for _, local_path, _, _ in self.selected_files]
+        with ThreadPoolExecutor(max_workers=min(8, len(local_paths))) as executor:
+            file_hashes = list(
+                executor.map(self.file_manager.calculate_file_hash, local_paths)
+            )
+
+        rows = []
+        seen_hashes = set()
+        for (original_path, local_path, filename, is_duplicate), file_hash in zip(
+            self.selected_files, file_hashes
+        ):
             file_size = Path(local_path).stat().st_size
-            file_hash = self.file_manager.calculate_file_hash(local_path)
-            hash_duplicate = self.database_manager.check_duplicate_by_hash(file_hash)
+            # Aynı seçimdeki eş dosyalar henüz veritabanında olmadığından ayrıca kontrol et
+            hash_duplicate = (
+                file_hash in seen_hashes
+                or self.database_manager.check_duplicate_by_hash(file_hash)
+            )
+            seen_hashes.add(file_hash)
 
-            self.database_manager.log_file_selection(
-                filename,
-                file_hash,
-                file_size,
-                user_name,
-                original_path,
-                local_path,
-                hash_duplicate or is_duplicate,
+            rows.append(
+                (
+                    filename,
+                    file_hash,
+                    file_size,
+                    user_name,
+                    original_path,
+                    local_path,
+                    hash_duplicate or is_duplicate,
+                )
             )
 
+        self.database_manager.log_file_selection_many(rows)
+        self._local_files_dirty = True
+
+    def _start_progress(self) -> None:
+        """Progress bar animasyonunu başlat."""
+        self._stop_progress()
+        self._progress_job = self.root.after(100, self._progress_tick)
+
+    def _progress_tick(self) -> None:
+        """Progress bar'ı bir adım ilerlet ve sonraki adımı planla."""
+        self.progress.step(2)
+        self._progress_job = self.root.after(100, self._progress_tick)
+
+    def _stop_progress(self) -> None:
+        """Progress bar animasyonunu durdur ve sıfırla."""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+        self.progress["value"] = 0
+
+    def _get_local_files(self) -> List[Path]:
+        """Yerel dosya listesini önbellekten getir, gerekirse yenile."""
+        if self._local_files_dirty:
+            self._local_files_cache = self.file_manager.get_local_files()
+            self._local_files_dirty = False
+        return self._local_files_cache
+
     def update_file_count(self) -> None:
         """Seçilen dosya sayısını güncelle."""
-        local_files = self.file_manager.get_local_files()
+        local_files = self._get_local_files()
         count = len(local_files)
         self.selected_count_var.set(f"Yerel klasörde {count} dosya")
         self.upload_button.config(state="normal" if count > 0 else "disabled")
 
     def upload_files(self) -> None:
         """Dosyaları API'ya yükle."""
-        self.progress.start()
+        self._start_progress()
         self.upload_button.config(state="disabled")
 
         if self.thread_manager:
-            local_files = self.file_manager.get_local_files()
+            local_files = self._get_local_files()
             self.thread_manager.run_upload_thread(
                 lambda: self.api_client.upload_files_to_api(local_files),
                 self.upload_complete,
             )
         else:
-            local_files = self.file_manager.get_local_files()
+            local_files = self._get_local_files()
             result = self.api_client.upload_files_to_api(local_files)
             self.upload_complete(result)
 
     def upload_complete(self, result: Dict[str, Any]) -> None:
         """Yükleme tamamlandığında çağrılan fonksiyon."""
-        self.progress.stop()
+        # Hangi thread'den çağrılırsa çağrılsın Tk işlemleri ana thread'de yapılır
+        self.root.after(0, self._upload_complete_impl, result)
+
+    def _upload_complete_impl(self, result: Dict[str, Any]) -> None:
+        """Yükleme sonucunu ana thread'de işle."""
+        self._local_files_dirty = True
+        self._stop_progress()
         self.upload_button.config(state="normal")
 
         if result["success"]:
@@ -750,11 +1030,11 @@ class ModernGUIComponents:
                 "upload_failed", result["error"]
             )
 
-        self.refresh_logs()
+        self._schedule_refresh()
 
     def process_embeddings(self) -> None:
         """Embeddings işlemini başlat."""
-        self.progress.start()
+        self._start_progress()
         self.process_button.config(state="disabled")
 
         if self.thread_manager:
@@ -767,7 +1047,12 @@ class ModernGUIComponents:
 
     def process_complete(self, result: Dict[str, Any]) -> None:
         """İşleme tamamlandığında çağrılan fonksiyon."""
-        self.progress.stop()
+        self.root.after(0, self._process_complete_impl, result)
+
+    def _process_complete_impl(self, result: Dict[str, Any]) -> None:
+        """İşleme sonucunu ana thread'de işle."""
+        self._local_files_dirty = True
+        self._stop_progress()
         self.process_button.config(state="normal")
 
         if result["success"]:
@@ -777,7 +1062,7 @@ class ModernGUIComponents:
             messagebox.showerror("Hata", f"İşleme hatası: {result['error']}")
             self.database_manager.update_processing_status("failed", result["error"])
 
-        self.refresh_logs()
+        self._schedule_refresh()
 
     def process_all(self) -> None:
         """Tüm işlemleri sırayla çalıştır."""
@@ -786,26 +1071,55 @@ class ModernGUIComponents:
         # Upload işlemini başlat
         self.upload_files()
 
+    def _schedule_refresh(self) -> None:
+        """Log yenilemesini Tk boşa çıktığında çalışacak şekilde planla."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        """Planlanmış log yenilemesini çalıştır."""
+        self._refresh_pending = False
+        self.refresh_logs()
+
     def refresh_logs(self) -> None:
         """Logları veritabanından yenile."""
         if not self.tree:
             return
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        order_by = self._SQL_SORT_COLUMNS.get(self.sort_column)
+        if order_by:
+            logs = self.database_manager.get_filtered_logs(
+                self._get_active_filters(),
+                columns=self._LOG_QUERY_COLUMNS,
+                order_by=order_by,
+                descending=self.sort_reverse,
+            )
+        else:
+            logs = self.database_manager.get_filtered_logs(
+                self._get_active_filters(), columns=self._LOG_QUERY_COLUMNS
+            )
+        self._commit_rows(self._format_rows(logs))
+        self.update_file_count()
 
-        # Filtrelerin varlığını kontrol et
-        filters = {}
-        if hasattr(self, "status_filter") and self.status_filter:
-            filters["status_filter"] = self.status_filter.get()
-        if hasattr(self, "user_filter") and self.user_filter:
-            filters["user_filter"] = self.user_filter.get()
-        if hasattr(self, "date_filter") and self.date_filter:
-            filters["date_filter"] = self.date_filter.get()
-        if hasattr(self, "format_filter") and self.format_filter:
-            filters["format_filter"] = self.format_filter.get()
+    def _format_rows(self, logs: List[tuple]) -> List[tuple]:
+        """
+        Log kayıtlarını Treeview satırlarına dönüştür.
+
+        Saf Python döngüsüdür, Tk çağrısı içermez.
+
+        Args:
+            logs: _LOG_QUERY_COLUMNS sırasındaki log kayıtları
 
-        logs = self.database_manager.get_filtered_logs(filters)
+        Returns:
+            Treeview'a eklenecek değer tuple'ları
+        """
+        rows = []
+        append = rows.append
+        status_map = self._STATUS_MAP
+        ts = _ts
+        fmt_size = self.file_manager.format_file_size
 
         for row in logs:
             (
@@ -814,10 +1128,6 @@ class ModernGUIComponents:
                 file_size,
                 user_name,
                 selection_time,
-                upload_end_time,
-                upload_duration,
-                processing_end_time,
-                processing_duration,
                 upload_status,
                 processing_status,
                 is_duplicate,
@@ -827,63 +1137,59 @@ class ModernGUIComponents:
                 last_duplicate_time,
             ) = row
 
+            last_ts = ts(last_duplicate_time)
+            has_overwrite = overwrite_count and overwrite_count > 0
+
             # Durumu belirle
-            if is_duplicate and overwrite_count and overwrite_count > 0:
+            if is_duplicate and has_overwrite:
                 status = f"OVERWRITE ({overwrite_count}x)"
             elif is_duplicate:
-                if last_duplicate_time:
-                    last_time = last_duplicate_time.split(".")[0]
-                    status = f"DUPLICATE (Son: {last_time})"
-                else:
-                    status = "DUPLICATE"
-            elif processing_status == "completed":
-                status = "PROCESSED"
-            elif processing_status == "failed":
-                status = "PROC_FAILED"
-            elif upload_status == "uploaded":
-                status = "UPLOADED"
-            elif upload_status == "upload_failed":
-                status = "UP_FAILED"
-            elif upload_status == "uploading":
-                status = "UPLOADING"
-            elif processing_status == "processing":
-                status = "PROCESSING"
+                status = f"DUPLICATE (Son: {last_ts})" if last_ts else "DUPLICATE"
             else:
-                status = "SELECTED"
+                status = status_map.get(
+                    (upload_status, processing_status)
+                ) or _derive_status(upload_status, processing_status)
 
-            # Tarih formatı
-            sel_time = selection_time.split(".")[0] if selection_time else ""
+            # Overwrite bilgisi
+            if has_overwrite:
+                overwrite_info = (
+                    f"{overwrite_count}x ({last_ts})"
+                    if last_ts
+                    else f"{overwrite_count}x"
+                )
+            else:
+                overwrite_info = ""
 
             # Hata mesajı
             error_msg = upload_error or processing_error or ""
-            if error_msg and len(error_msg) > 50:
+            if len(error_msg) > 50:
                 error_msg = error_msg[:47] + "..."
 
-            # Overwrite bilgisi
-            if overwrite_count and overwrite_count > 0:
-                overwrite_info = f"{overwrite_count}x"
-                if last_duplicate_time:
-                    last_time = last_duplicate_time.split(".")[0]
-                    overwrite_info += f" ({last_time})"
-            else:
-                overwrite_info = ""
-
-            self.tree.insert(
-                "",
-                "end",
-                values=(
+            append(
+                (
                     filename,
                     file_extension,
-                    self.file_manager.format_file_size(file_size),
+                    fmt_size(file_size),
                     user_name,
-                    sel_time,
+                    ts(selection_time),
                     status,
                     overwrite_info,
                     error_msg,
-                ),
+                )
             )
 
-        self.update_file_count()
+        return rows
+
+    def _commit_rows(self, rows: List[tuple]) -> None:
+        """Treeview içeriğini verilen satırlarla değiştir."""
+        self._python_sorted_column = None
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        insert = self.tree.insert
+        for values in rows:
+            insert("", "end", values=values)
 
     def clear_logs(self) -> None:
         """Logları temizle."""
@@ -891,14 +1197,16 @@ class ModernGUIComponents:
             "Onay", "Tüm logları silmek istediğinizden emin misiniz?"
         ):
             self.database_manager.clear_logs()
+            self._local_files_dirty = True
             self.refresh_logs()
             self.update_user_filter()
             messagebox.showinfo("Başarılı", "Loglar temizlendi")
 
     def generate_summary_report(self) -> None:
         """Özet rapor oluştur."""
-        today_str = datetime.now().strftime("%d_%m_%Y")
-        default_filename = f"ozet_rapor_{today_str}.html"
+        # Dosya adı ve rapor başlığı aynı zamanı gösterir
+        now = datetime.now()
+        default_filename = f"ozet_rapor_{now.strftime('%d_%m_%Y')}.html"
 
         filepath = filedialog.asksaveasfilename(
             initialfile=default_filename,
@@ -910,8 +1218,26 @@ class ModernGUIComponents:
         if not filepath:
             return
 
+        # Sorgu ve dosya yazımı arka planda yapılır, GUI donmaz
+        self.root.config(cursor="watch")
+        future = self._io_pool.submit(self._build_summary, filepath, now)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_summary_done, f, filepath)
+        )
+
+    def _build_summary(self, filepath: str, now: datetime) -> bool:
+        """Özet istatistikleri topla ve raporu yaz (işçi thread'de çalışır)."""
         stats = self.database_manager.get_summary_stats()
-        success = self.report_generator.generate_summary_report(stats, filepath)
+        return self.report_generator.generate_summary_report(stats, filepath, now=now)
+
+    def _on_summary_done(self, future: Future, filepath: str) -> None:
+        """Özet rapor sonucunu ana thread'de bildir."""
+        self.root.config(cursor="")
+        try:
+            success = future.result()
+        except Exception as e:
+            print(f"Özet rapor oluşturma hatası: {e}")
+            success = False
 
         if success:
             messagebox.showinfo(
@@ -959,7 +1285,7 @@ class ModernGUIComponents:
             "Hatalı",
             "Kullanıcı",
         )
-        tree = ttk.Treeview(
+        tree = VirtualTreeview(
             tree_frame,
             columns=columns,
             show="headings",
@@ -982,50 +1308,12 @@ class ModernGUIComponents:
             tree.heading(col, text=col)
             tree.column(col, width=column_widths.get(col, 100), anchor=tk.CENTER)
 
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
+        tree.attach_scrollbar(scrollbar)
 
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=15, padx=(0, 15))
 
-        # Verileri yükle
-        api_stats = self.database_manager.get_api_stats()
-
-        for row in api_stats:
-            (
-                operation_type,
-                start_time,
-                end_time,
-                duration,
-                file_count,
-                total_size_bytes,
-                success_count,
-                error_count,
-                error_message,
-                user_name,
-            ) = row
-
-            start_formatted = start_time.split(".")[0] if start_time else ""
-            end_formatted = end_time.split(".")[0] if end_time else ""
-            duration_formatted = (
-                self.report_generator.format_duration(duration) if duration else ""
-            )
-
-            tree.insert(
-                "",
-                "end",
-                values=(
-                    operation_type.title(),
-                    start_formatted,
-                    end_formatted,
-                    duration_formatted,
-                    file_count or 0,
-                    success_count or 0,
-                    error_count or 0,
-                    user_name,
-                ),
-            )
-
         # Butonlar
         button_frame = tk.Frame(main_frame, bg=self.colors["bg_primary"])
         button_frame.pack(fill=tk.X, pady=(15, 0))
@@ -1038,6 +1326,51 @@ class ModernGUIComponents:
             width=120,
         ).pack(side=tk.RIGHT)
 
+        # Veriler arka planda okunur, pencere hemen açılır
+        future = self._io_pool.submit(self.database_manager.get_api_stats)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._fill_api_stats, tree, f)
+        )
+
+    def _fill_api_stats(self, tree: VirtualTreeview, future: Future) -> None:
+        """Arka planda okunan API istatistiklerini ağaca yükle."""
+        # Sonuç gelmeden pencere kapatılmış olabilir
+        if not tree.winfo_exists():
+            return
+        try:
+            api_stats = future.result()
+        except Exception as e:
+            print(f"API istatistikleri okunamadı: {e}")
+            return
+
+        # Satırlar önce Python tarafında hazırlanır
+        format_duration = self.report_generator.format_duration
+        rows = [
+            (
+                operation_type.title(),
+                _ts(start_time),
+                _ts(end_time),
+                format_duration(duration) if duration else "",
+                file_count or 0,
+                success_count or 0,
+                error_count or 0,
+                user_name,
+            )
+            for (
+                operation_type,
+                start_time,
+                end_time,
+                duration,
+                file_count,
+                success_count,
+                error_count,
+                user_name,
+            ) in api_stats
+        ]
+
+        # Ağaca yalnızca görünen satırlar eklenir
+        tree.set_rows(rows)
+
     def sort_treeview(self, col: str) -> None:
         """Treeview kolonuna göre sırala."""
         if self.sort_column == col:
@@ -1046,58 +1379,52 @@ class ModernGUIComponents:
             self.sort_column = col
             self.sort_reverse = False
 
+        if col in self._SQL_SORT_COLUMNS:
+            # İndeksli kolonlar veritabanında sıralanır
+            self.refresh_logs()
+        else:
+            self._sort_rows_in_python(col)
+
+        # Kolon başlığını güncelle
+        for c in self._LOG_COLUMNS:
+            if c == col:
+                direction = "↓" if self.sort_reverse else "↑"
+                self.tree.heading(c, text=f"{c} {direction}")
+            else:
+                self.tree.heading(c, text=c)
+
+    def _sort_rows_in_python(self, col: str) -> None:
+        """Veritabanında sıralanamayan kolonlar için Treeview satırlarını sırala."""
+        children = self.tree.get_children()
+        if self._python_sorted_column == col:
+            # Aynı kolonda yön değişti; satırlar zaten sıralı, ters çevirmek yeter
+            for index, child in enumerate(reversed(children)):
+                self.tree.move(child, "", index)
+            return
+
         data = []
-        for child in self.tree.get_children():
+        for child in children:
             values = self.tree.item(child)["values"]
             data.append((child, values))
 
-        columns = (
-            "Dosya",
-            "Format",
-            "Boyut",
-            "Kullanıcı",
-            "Seçim",
-            "Durum",
-            "Overwrite",
-            "Hata",
-        )
-
-        def sort_key(item):
-            value = item[1][columns.index(col)]
-
-            if col == "Boyut":
-                try:
-                    if "MB" in str(value):
-                        return float(str(value).replace("MB", "").strip()) * 1024 * 1024
-                    elif "KB" in str(value):
-                        return float(str(value).replace("KB", "").strip()) * 1024
-                    else:
-                        return float(str(value).replace("B", "").strip() or 0)
-                except:
-                    return 0
-            elif col == "Seçim":
-                try:
-                    if value:
-                        return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S")
-                    else:
-                        return datetime.min
-                except:
-                    return datetime.min
-            else:
-                return str(value)
-
-        data.sort(key=sort_key, reverse=self.sort_reverse)
+        # Bu kolonlar türetilmiş metinlerdir; metin olarak sıralanır
+        col_idx = self._LOG_COLUMNS.index(col)
+        data.sort(key=lambda item: str(item[1][col_idx]), reverse=self.sort_reverse)
 
         for index, (child, values) in enumerate(data):
             self.tree.move(child, "", index)
+        self._python_sorted_column = col
 
-        # Kolon başlığını güncelle
-        for c in columns:
-            if c == col:
-                direction = "↓" if self.sort_reverse else "↑"
-                self.tree.heading(c, text=f"{c} {direction}")
-            else:
-                self.tree.heading(c, text=c)
+    def _get_active_filters(self) -> Dict[str, str]:
+        """Seçili filtreleri getir; "Tümü" olanlar sorguya hiç eklenmez."""
+        filters = {}
+        for name in ("status_filter", "user_filter", "date_filter", "format_filter"):
+            var = getattr(self, name, None)
+            if var:
+                value = var.get()
+                if value and value != "Tümü":
+                    filters[name] = value
+        return filters
 
     def apply_filters(self, event=None) -> None:
         """Filtreleri uygula."""
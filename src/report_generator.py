@@ -5,10 +5,413 @@ Bu modül HTML ve CSV raporları oluşturur.
 """
 
 import csv
+import string
+import functools
+import itertools
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Iterable, Optional
 from collections import defaultdict
 
+# Raporlar diske doğrudan, büyük bir tamponla yazılır
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# CSV satırları bu büyüklükte gruplar halinde yazılır
+_CSV_BATCH_SIZE = 1000
+
+# Detay raporda tek writelines çağrısıyla yazılan satır sayısı
+_HTML_ROW_BATCH_SIZE = 512
+
+# Rapor başlıklarındaki tarih formatı
+_REPORT_DATE_FORMAT = "%d.%m.%Y %H:%M:%S"
+
+_CELL_TEMPLATE = "<td>{val}</td>"
+_CELL_TEMPLATE_CLASS = '<td class="{cls}">{val}</td>'
+
+# Detay rapor kolon türleri; satır döngüsünde tamsayı karşılaştırmasıyla dallanılır
+_K_DEFAULT, _K_STATUS, _K_ERROR, _K_DURATION, _K_SIZE = range(5)
+
+# Durum değeri -> CSS sınıfı ("failed" içeren değerler ayrıca ele alınır)
+_STATUS_CLASSES = {
+    "completed": "status-processed",
+    "uploaded": "status-uploaded",
+    "duplicate": "status-duplicate",
+}
+
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _esc(value: Any) -> str:
+    """
+    Değeri HTML içine yazılabilecek şekilde kaçışla.
+
+    Args:
+        value: Hücre değeri
+
+    Returns:
+        Kaçışlanmış metin, boş değerler için boş string
+    """
+    return str(value).translate(_HTML_ESCAPE) if value else ""
+
+
+def _column_kind(column: str) -> int:
+    """
+    Kolon adından hücrelerin nasıl yazılacağını belirle.
+
+    Args:
+        column: Veritabanı kolon adı
+
+    Returns:
+        _K_* sabitlerinden biri
+    """
+    if column in ("upload_status", "processing_status"):
+        return _K_STATUS
+    if "error" in column:
+        return _K_ERROR
+    if "duration" in column:
+        return _K_DURATION
+    if "size" in column:
+        return _K_SIZE
+    return _K_DEFAULT
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_duration(seconds: float) -> str:
+    """Bir ondalığa yuvarlanmış süreyi formatla (önbellekli)."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes = int(seconds // 60)
+    secs = seconds % 60
+    return f"{minutes}m {secs:.1f}s"
+
+
+def _write_rows(
+    f,
+    rows: Iterable[Tuple],
+    col_kind: List[int],
+    fmt_size: Callable[[int], str],
+    fmt_duration: Callable[[float], str],
+) -> int:
+    """
+    Detay raporun satırlarını dosyaya yaz.
+
+    Her satır UTF-8 olarak kodlanıp bir listede toplanır ve her
+    _HTML_ROW_BATCH_SIZE satırda bir tek writelines çağrısıyla yazılır;
+    sık kullanılan isimler yerel değişkenlere alınır.
+
+    Args:
+        f: İkili modda açılmış dosya nesnesi
+        rows: Satır verileri
+        col_kind: Her kolonun _K_* türü
+        fmt_size: Dosya boyutu formatlama fonksiyonu
+        fmt_duration: Süre formatlama fonksiyonu
+
+    Returns:
+        Yazılan satır sayısı
+    """
+    esc = _esc
+    status_classes = _STATUS_CLASSES
+    cell = _CELL_TEMPLATE.format
+    cell_class = _CELL_TEMPLATE_CLASS.format
+    batch_size = _HTML_ROW_BATCH_SIZE
+
+    batch = []
+    count = 0
+    for row in rows:
+        parts = ["<tr>"]
+        append = parts.append
+        for kind, value in zip(col_kind, row):
+            if kind == _K_DEFAULT:
+                append(cell(val=esc(value)))
+            elif kind == _K_STATUS:
+                css_class = status_classes.get(value) or (
+                    "status-failed" if "failed" in str(value) else ""
+                )
+                append(cell_class(cls=css_class, val=esc(value)))
+            elif kind == _K_ERROR:
+                append(cell_class(cls="error", val=esc(value)))
+            elif kind == _K_DURATION and value:
+                append(cell(val=fmt_duration(value)))
+            elif kind == _K_SIZE and value:
+                append(cell(val=fmt_size(value)))
+            else:
+                append(cell(val=esc(value)))
+        append("</tr>")
+        batch.append("".join(parts).encode("utf-8"))
+        count += 1
+        if len(batch) >= batch_size:
+            f.writelines(batch)
+            batch.clear()
+    if batch:
+        f.writelines(batch)
+    return count
+
+
+_DETAIL_HEAD = """
+<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Document Upload Manager - Detaylı Rapor</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; font-weight: bold; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        .status-processed { color: green; font-weight: bold; }
+        .status-failed { color: red; font-weight: bold; }
+        .status-uploaded { color: blue; }
+        .status-duplicate { color: orange; }
+        .error { color: red; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+"""
+_DETAIL_HEAD_BYTES = _DETAIL_HEAD.encode("utf-8")
+
+# Satırlar akış halinde yazıldığı için kayıt sayısı tablodan sonra yazılır
+_DETAIL_FOOT_TEMPLATE = """
+        </tbody>
+    </table>
+    <p>Toplam Kayıt Sayısı: {count}</p>
+</body>
+</html>
+"""
+
+_SUMMARY_HEAD = """
+<!DOCTYPE html>
+<html lang="tr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Document Upload Manager - Özet Rapor</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        h1 { color: #333; text-align: center; margin-bottom: 30px; }
+        h2 { color: #555; border-bottom: 2px solid #4CAF50; padding-bottom: 10px; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }
+        .stat-card { background: #f9f9f9; padding: 20px; border-radius: 8px; border-left: 4px solid #4CAF50; }
+        .stat-number { font-size: 2em; font-weight: bold; color: #4CAF50; }
+        .stat-label { color: #666; font-size: 0.9em; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
+        th { background-color: #4CAF50; color: white; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+        .success { color: #4CAF50; font-weight: bold; }
+        .warning { color: #FF9800; font-weight: bold; }
+        .error { color: #f44336; font-weight: bold; }
+        .chart-container { margin: 20px 0; }
+        .progress-bar { background-color: #ddd; border-radius: 10px; overflow: hidden; height: 20px; }
+        .progress-fill { height: 100%; background-color: #4CAF50; transition: width 0.3s ease; }
+    </style>
+</head>
+<body>
+"""
+
+# Özet raporun sabit bölümleri, bytearray'e doğrudan eklenebilmesi için
+# modül yüklenirken bir kez kodlanır
+_SUMMARY_HEAD_BYTES = _SUMMARY_HEAD.encode("utf-8")
+
+_FORMAT_TABLE_HEAD_BYTES = """
+            </tbody>
+        </table>
+        
+        <h2>📁 Format Bazlı İstatistikler</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Format</th>
+                    <th>Dosya Sayısı</th>
+                    <th>Toplam Boyut</th>
+                    <th>Ort. Yükleme Süresi</th>
+                    <th>Ort. İşleme Süresi</th>
+                </tr>
+            </thead>
+            <tbody>""".encode("utf-8")
+
+_DAILY_TABLE_HEAD_BYTES = """
+            </tbody>
+        </table>
+        
+        <h2>📅 Günlük Aktivite (Son 30 Gün)</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Tarih</th>
+                    <th>Dosya Sayısı</th>
+                    <th>Aktivite</th>
+                </tr>
+            </thead>
+            <tbody>""".encode("utf-8")
+
+# Tablolardan önceki özet bölümü; modül yüklenirken bir kez derlenir ve
+# tek bir substitute çağrısıyla doldurulur
+_SUMMARY_TEMPLATE = string.Template("""    <div class="container">
+        <h1>📊 Document Upload Manager - Özet Rapor</h1>
+        <p style="text-align: center; color: #666;">Rapor Tarihi: $report_date</p>
+        
+        <h2>🎯 Genel İstatistikler</h2>
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-number">$total_files</div>
+                <div class="stat-label">Toplam Dosya</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number success">$processed</div>
+                <div class="stat-label">İşlenmiş Dosya</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number warning">$uploaded</div>
+                <div class="stat-label">Yüklenmiş (Bekleyen)</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number error">$total_failed</div>
+                <div class="stat-label">Başarısız</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">$duplicates</div>
+                <div class="stat-label">Tekrarlanan</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" style="color: #2196F3;">$success_rate_text%</div>
+                <div class="stat-label">Başarı Oranı</div>
+            </div>
+        </div>
+        
+        <h2>📈 Başarı Oranı</h2>
+        <div class="progress-bar">
+            <div class="progress-fill" style="width: $success_rate%;"></div>
+        </div>
+        <p style="text-align: center; margin-top: 10px;">Başarı Oranı: $success_rate_text% ($processed/$total_files dosya)</p>
+        
+        <h2>👥 Kullanıcı Bazlı İstatistikler</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Kullanıcı</th>
+                    <th>Toplam Dosya</th>
+                    <th>İşlenmiş</th>
+                    <th>Başarı Oranı</th>
+                    <th>Toplam Boyut</th>
+                </tr>
+            </thead>
+            <tbody>""")
+
+_SUMMARY_FOOT_TEMPLATE = string.Template("""
+            </tbody>
+        </table>
+        
+        <h2>⚠️ Durum Dağılımı</h2>
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-number">$selected</div>
+                <div class="stat-label">Seçilmiş</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" style="color: #2196F3;">$uploaded</div>
+                <div class="stat-label">Yüklenmiş</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number success">$processed</div>
+                <div class="stat-label">İşlenmiş</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number error">$upload_failed</div>
+                <div class="stat-label">Yükleme Hatası</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number error">$proc_failed</div>
+                <div class="stat-label">İşleme Hatası</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number warning">$duplicates</div>
+                <div class="stat-label">Tekrarlanan</div>
+            </div>
+        </div>
+        
+        <div style="margin-top: 40px; text-align: center; color: #666; font-size: 0.9em;">
+            <p>Bu rapor Document Upload Manager tarafından otomatik olarak oluşturulmuştur.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+# Satır şablonları her satırda kullanıldığından str.format kalıbı olarak tutulur
+_USER_ROW_FORMAT = """
+                <tr>
+                    <td>{user}</td>
+                    <td>{total}</td>
+                    <td class="success">{processed}</td>
+                    <td><span class="{cls}">{rate}%</span></td>
+                    <td>{size}</td>
+                </tr>"""
+
+_FORMAT_ROW_FORMAT = """
+                <tr>
+                    <td><strong>{ext}</strong></td>
+                    <td>{count}</td>
+                    <td>{size}</td>
+                    <td>{upload_time}</td>
+                    <td>{proc_time}</td>
+                </tr>"""
+
+_DAILY_ROW_FORMAT = """
+                <tr>
+                    <td>{date}</td>
+                    <td>{count}</td>
+                    <td>
+                        <div style="background-color: #e0e0e0; height: 20px; border-radius: 10px; overflow: hidden;">
+                            <div style="background-color: #4CAF50; height: 100%; width: {width}%; transition: width 0.3s ease;"></div>
+                        </div>
+                    </td>
+                </tr>"""
+
+
+def _rate_class(rate: float) -> str:
+    """
+    Başarı oranına göre CSS sınıfını belirle.
+
+    Args:
+        rate: Yüzde cinsinden başarı oranı
+
+    Returns:
+        "success", "warning" veya "error"
+    """
+    if rate >= 80:
+        return "success"
+    if rate >= 50:
+        return "warning"
+    return "error"
+
+
+def _user_row(user_name: Any, total: int, processed: int, size: str) -> str:
+    """
+    Kullanıcı tablosu için tek bir HTML satırı oluştur.
+
+    Args:
+        user_name: Kullanıcı adı
+        total: Toplam dosya sayısı
+        processed: İşlenen dosya sayısı
+        size: Biçimlendirilmiş toplam boyut
+
+    Returns:
+        HTML satırı
+    """
+    rate = (processed / total * 100) if total > 0 else 0
+    return _USER_ROW_FORMAT.format(
+        user=_esc(user_name),
+        total=total,
+        processed=processed,
+        cls=_rate_class(rate),
+        rate=f"{rate:.1f}",
+        size=size,
+    )
+
 
 class ReportGenerator:
     """Rapor oluşturma işlemlerini yöneten sınıf."""
@@ -22,10 +425,14 @@ class ReportGenerator:
         """
         self.file_manager = file_manager
 
-    def format_duration(self, seconds: float) -> str:
+    @staticmethod
+    def format_duration(seconds: float) -> str:
         """
         Süreyi formatla.
 
+        Çıktı zaten bir ondalık gösterdiği için süre önce bir ondalığa
+        yuvarlanır; böylece aynı görünen süreler önbellekte tek kayıt olur.
+
         Args:
             seconds: Saniye cinsinden süre
 
@@ -34,23 +441,24 @@ class ReportGenerator:
         """
         if seconds is None:
             return ""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        else:
-            minutes = int(seconds // 60)
-            secs = seconds % 60
-            return f"{minutes}m {secs:.1f}s"
+        return _format_duration(round(seconds, 1))
 
     def generate_detail_report(
-        self, columns: List[str], data: List[Tuple], filepath: str
+        self,
+        columns: List[str],
+        data: Iterable[Tuple],
+        filepath: str,
+        now: Optional[datetime] = None,
     ) -> bool:
         """
         Detaylı rapor oluştur.
 
         Args:
             columns: Kolon başlıkları
-            data: Rapor verileri
+            data: Rapor verileri; liste ya da doğrudan bir SQLite cursor'ı
+                olabilir, satırlar tek geçişte okunur
             filepath: Kayıt dosya yolu
+            now: Rapor tarihi; verilmezse o anki zaman kullanılır
 
         Returns:
             Rapor oluşturma başarılı olup olmadığı
@@ -59,125 +467,103 @@ class ReportGenerator:
             if filepath.endswith(".csv"):
                 return self._generate_csv_report(filepath, columns, data)
             else:
-                return self._generate_html_detail_report(filepath, columns, data)
+                return self._generate_html_detail_report(
+                    filepath, columns, data, now or datetime.now()
+                )
         except Exception as e:
             print(f"Detay rapor oluşturma hatası: {e}")
             return False
 
     def _generate_csv_report(
-        self, filepath: str, columns: List[str], data: List[Tuple]
+        self, filepath: str, columns: List[str], data: Iterable[Tuple]
     ) -> bool:
         """CSV rapor oluştur."""
         try:
-            with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
+            with open(
+                filepath,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=_WRITE_BUFFER_SIZE,
+            ) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(columns)
-                writer.writerows(data)
+                rows = iter(data)
+                while True:
+                    batch = list(itertools.islice(rows, _CSV_BATCH_SIZE))
+                    if not batch:
+                        break
+                    writer.writerows(batch)
             return True
         except Exception as e:
             print(f"CSV raporu oluşturulamadı: {e}")
             return False
 
     def _generate_html_detail_report(
-        self, filepath: str, columns: List[str], data: List[Tuple]
+        self,
+        filepath: str,
+        columns: List[str],
+        data: Iterable[Tuple],
+        now: datetime,
     ) -> bool:
         """HTML detay rapor oluştur."""
         try:
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Document Upload Manager - Detaylı Rapor</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; font-weight: bold; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        .status-processed {{ color: green; font-weight: bold; }}
-        .status-failed {{ color: red; font-weight: bold; }}
-        .status-uploaded {{ color: blue; }}
-        .status-duplicate {{ color: orange; }}
-        .error {{ color: red; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <h1>Document Upload Manager - Detaylı Rapor</h1>
-    <p>Rapor Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}</p>
-    <p>Toplam Kayıt Sayısı: {len(data)}</p>
+            date_str = now.strftime(_REPORT_DATE_FORMAT)
+            header = f"""    <h1>Document Upload Manager - Detaylı Rapor</h1>
+    <p>Rapor Tarihi: {date_str}</p>
     
     <table>
         <thead>
             <tr>
-                {''.join(f'<th>{col}</th>' for col in columns)}
+                {''.join(f'<th>{_esc(col)}</th>' for col in columns)}
             </tr>
         </thead>
         <tbody>
 """
 
-            for row in data:
-                html_content += "<tr>"
-                for i, cell in enumerate(row):
-                    if columns[i] in ["upload_status", "processing_status"]:
-                        css_class = ""
-                        if cell == "completed":
-                            css_class = "status-processed"
-                        elif "failed" in str(cell):
-                            css_class = "status-failed"
-                        elif cell == "uploaded":
-                            css_class = "status-uploaded"
-                        elif cell == "duplicate":
-                            css_class = "status-duplicate"
-
-                        html_content += f'<td class="{css_class}">{cell or ""}</td>'
-                    elif "error" in columns[i]:
-                        html_content += f'<td class="error">{cell or ""}</td>'
-                    elif "duration" in columns[i] and cell:
-                        html_content += f"<td>{self.format_duration(cell)}</td>"
-                    elif "size" in columns[i] and cell:
-                        html_content += (
-                            f"<td>{self.file_manager.format_file_size(cell)}</td>"
-                        )
-                    else:
-                        html_content += f'<td>{cell or ""}</td>'
-                html_content += "</tr>"
-
-            html_content += """
-        </tbody>
-    </table>
-</body>
-</html>
-"""
+            # Kolon türleri döngüden önce bir kez belirlenir
+            col_kind = [_column_kind(col) for col in columns]
+
+            with open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(_DETAIL_HEAD_BYTES)
+                f.write(header.encode("utf-8"))
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(html_content)
+                # Boyut formatı rapor boyunca önbelleklenir
+                fmt_size = functools.lru_cache(maxsize=4096)(
+                    self.file_manager.format_file_size
+                )
+                count = _write_rows(f, data, col_kind, fmt_size, self.format_duration)
+
+                f.write(_DETAIL_FOOT_TEMPLATE.format(count=count).encode("utf-8"))
             return True
         except Exception as e:
             print(f"HTML raporu oluşturulamadı: {e}")
             return False
 
-    def generate_summary_report(self, stats: Dict[str, Any], filepath: str) -> bool:
+    def generate_summary_report(
+        self, stats: Dict[str, Any], filepath: str, now: Optional[datetime] = None
+    ) -> bool:
         """
         Özet rapor oluştur.
 
         Args:
             stats: İstatistik verileri
             filepath: Kayıt dosya yolu
+            now: Rapor tarihi; verilmezse o anki zaman kullanılır
 
         Returns:
             Rapor oluşturma başarılı olup olmadığı
         """
         try:
-            return self._generate_html_summary_report(filepath, stats)
+            return self._generate_html_summary_report(
+                filepath, stats, now or datetime.now()
+            )
         except Exception as e:
             print(f"Özet rapor oluşturma hatası: {e}")
             return False
 
     def _generate_html_summary_report(
-        self, filepath: str, stats: Dict[str, Any]
+        self, filepath: str, stats: Dict[str, Any], now: datetime
     ) -> bool:
         """HTML özet rapor oluştur."""
         try:
@@ -186,215 +572,88 @@ class ReportGenerator:
             format_stats = stats["format_stats"]
             daily_stats = stats["daily_stats"]
 
-            total_processed = status_counts.get("processed", 0)
-            total_failed = status_counts.get("upload_failed", 0) + status_counts.get(
-                "proc_failed", 0
-            )
-            success_rate = (
-                (total_processed / stats["total_files"] * 100)
-                if stats["total_files"] > 0
-                else 0
+            # Sayılar bir kez okunur, şablonlarda yerel değişkenler kullanılır
+            total_files = stats["total_files"]
+            n_processed = status_counts.get("processed", 0)
+            n_uploaded = status_counts.get("uploaded", 0)
+            n_upload_failed = status_counts.get("upload_failed", 0)
+            n_proc_failed = status_counts.get("proc_failed", 0)
+            n_duplicates = status_counts.get("duplicates", 0)
+            n_selected = status_counts.get("selected", 0)
+
+            total_failed = n_upload_failed + n_proc_failed
+            success_rate = (n_processed / total_files * 100) if total_files > 0 else 0
+            rate_str = f"{success_rate:.1f}"
+            fmt_size = functools.lru_cache(maxsize=4096)(
+                self.file_manager.format_file_size
             )
 
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Document Upload Manager - Özet Rapor</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; text-align: center; margin-bottom: 30px; }}
-        h2 {{ color: #555; border-bottom: 2px solid #4CAF50; padding-bottom: 10px; }}
-        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .stat-card {{ background: #f9f9f9; padding: 20px; border-radius: 8px; border-left: 4px solid #4CAF50; }}
-        .stat-number {{ font-size: 2em; font-weight: bold; color: #4CAF50; }}
-        .stat-label {{ color: #666; font-size: 0.9em; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-        th {{ background-color: #4CAF50; color: white; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        .success {{ color: #4CAF50; font-weight: bold; }}
-        .warning {{ color: #FF9800; font-weight: bold; }}
-        .error {{ color: #f44336; font-weight: bold; }}
-        .chart-container {{ margin: 20px 0; }}
-        .progress-bar {{ background-color: #ddd; border-radius: 10px; overflow: hidden; height: 20px; }}
-        .progress-fill {{ height: 100%; background-color: #4CAF50; transition: width 0.3s ease; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>📊 Document Upload Manager - Özet Rapor</h1>
-        <p style="text-align: center; color: #666;">Rapor Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}</p>
-        
-        <h2>🎯 Genel İstatistikler</h2>
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-number">{stats['total_files']}</div>
-                <div class="stat-label">Toplam Dosya</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number success">{status_counts.get('processed', 0)}</div>
-                <div class="stat-label">İşlenmiş Dosya</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number warning">{status_counts.get('uploaded', 0)}</div>
-                <div class="stat-label">Yüklenmiş (Bekleyen)</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number error">{total_failed}</div>
-                <div class="stat-label">Başarısız</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{status_counts.get('duplicates', 0)}</div>
-                <div class="stat-label">Tekrarlanan</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" style="color: #2196F3;">{success_rate:.1f}%</div>
-                <div class="stat-label">Başarı Oranı</div>
-            </div>
-        </div>
-        
-        <h2>📈 Başarı Oranı</h2>
-        <div class="progress-bar">
-            <div class="progress-fill" style="width: {success_rate}%;"></div>
-        </div>
-        <p style="text-align: center; margin-top: 10px;">Başarı Oranı: {success_rate:.1f}% ({status_counts.get('processed', 0)}/{stats['total_files']} dosya)</p>
-        
-        <h2>👥 Kullanıcı Bazlı İstatistikler</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Kullanıcı</th>
-                    <th>Toplam Dosya</th>
-                    <th>İşlenmiş</th>
-                    <th>Başarı Oranı</th>
-                    <th>Toplam Boyut</th>
-                </tr>
-            </thead>
-            <tbody>"""
-
-            for user_name, total, processed, total_size in user_stats:
-                success_rate_user = (processed / total * 100) if total > 0 else 0
-                size_formatted = self.file_manager.format_file_size(total_size or 0)
-
-                html_content += f"""
-                <tr>
-                    <td>{user_name}</td>
-                    <td>{total}</td>
-                    <td class="success">{processed}</td>
-                    <td>{'<span class="success">' if success_rate_user >= 80 else '<span class="warning"' if success_rate_user >= 50 else '<span class="error"'}{success_rate_user:.1f}%</span></td>
-                    <td>{size_formatted}</td>
-                </tr>"""
-
-            html_content += """
-            </tbody>
-        </table>
-        
-        <h2>📁 Format Bazlı İstatistikler</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Format</th>
-                    <th>Dosya Sayısı</th>
-                    <th>Toplam Boyut</th>
-                    <th>Ort. Yükleme Süresi</th>
-                    <th>Ort. İşleme Süresi</th>
-                </tr>
-            </thead>
-            <tbody>"""
-
-            for ext, count, total_size, avg_upload, avg_processing in format_stats:
-                size_formatted = self.file_manager.format_file_size(total_size or 0)
-                upload_time = self.format_duration(avg_upload) if avg_upload else "N/A"
-                proc_time = (
-                    self.format_duration(avg_processing) if avg_processing else "N/A"
+            values = {
+                "report_date": now.strftime(_REPORT_DATE_FORMAT),
+                "total_files": total_files,
+                "processed": n_processed,
+                "uploaded": n_uploaded,
+                "duplicates": n_duplicates,
+                "selected": n_selected,
+                "upload_failed": n_upload_failed,
+                "proc_failed": n_proc_failed,
+                "total_failed": total_failed,
+                "success_rate": success_rate,
+                "success_rate_text": rate_str,
+            }
+
+            # Özet rapor küçüktür; tek bir bytearray'de toplanıp tek seferde yazılır
+            buf = bytearray()
+            extend = buf.extend
+            extend(_SUMMARY_HEAD_BYTES)
+            extend(_SUMMARY_TEMPLATE.safe_substitute(values).encode("utf-8"))
+
+            user_rows = "".join(
+                _user_row(user_name, total, processed, fmt_size(total_size or 0))
+                for user_name, total, processed, total_size in user_stats
+            )
+            extend(user_rows.encode("utf-8"))
+
+            extend(_FORMAT_TABLE_HEAD_BYTES)
+
+            fmt_duration = self.format_duration
+            format_rows = "".join(
+                _FORMAT_ROW_FORMAT.format(
+                    ext=_esc(ext.upper()),
+                    count=count,
+                    size=fmt_size(total_size or 0),
+                    upload_time=fmt_duration(avg_upload) if avg_upload else "N/A",
+                    proc_time=(
+                        fmt_duration(avg_processing) if avg_processing else "N/A"
+                    ),
                 )
+                for ext, count, total_size, avg_upload, avg_processing in format_stats
+            )
+            extend(format_rows.encode("utf-8"))
 
-                html_content += f"""
-                <tr>
-                    <td><strong>{ext.upper()}</strong></td>
-                    <td>{count}</td>
-                    <td>{size_formatted}</td>
-                    <td>{upload_time}</td>
-                    <td>{proc_time}</td>
-                </tr>"""
+            extend(_DAILY_TABLE_HEAD_BYTES)
 
-            html_content += """
-            </tbody>
-        </table>
-        
-        <h2>📅 Günlük Aktivite (Son 30 Gün)</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Tarih</th>
-                    <th>Dosya Sayısı</th>
-                    <th>Aktivite</th>
-                </tr>
-            </thead>
-            <tbody>"""
+            # En yoğun gün sorgu sırasında bulunur; bölme satır başına değil bir kez
+            max_daily = stats.get("daily_max") or max(
+                (count for _, count in daily_stats), default=1
+            )
+            inv_max = 100.0 / max_daily if max_daily > 0 else 0
 
-            max_daily = max([count for _, count in daily_stats]) if daily_stats else 1
+            daily_rows = "".join(
+                _DAILY_ROW_FORMAT.format(
+                    date=_esc(date),
+                    count=count,
+                    width=count * inv_max,
+                )
+                for date, count in daily_stats
+            )
+            extend(daily_rows.encode("utf-8"))
 
-            for date, count in daily_stats:
-                activity_width = (count / max_daily * 100) if max_daily > 0 else 0
+            extend(_SUMMARY_FOOT_TEMPLATE.safe_substitute(values).encode("utf-8"))
 
-                html_content += f"""
-                <tr>
-                    <td>{date}</td>
-                    <td>{count}</td>
-                    <td>
-                        <div style="background-color: #e0e0e0; height: 20px; border-radius: 10px; overflow: hidden;">
-                            <div style="background-color: #4CAF50; height: 100%; width: {activity_width}%; transition: width 0.3s ease;"></div>
-                        </div>
-                    </td>
-                </tr>"""
-
-            html_content += f"""
-            </tbody>
-        </table>
-        
-        <h2>⚠️ Durum Dağılımı</h2>
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-number">{status_counts.get('selected', 0)}</div>
-                <div class="stat-label">Seçilmiş</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" style="color: #2196F3;">{status_counts.get('uploaded', 0)}</div>
-                <div class="stat-label">Yüklenmiş</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number success">{status_counts.get('processed', 0)}</div>
-                <div class="stat-label">İşlenmiş</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number error">{status_counts.get('upload_failed', 0)}</div>
-                <div class="stat-label">Yükleme Hatası</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number error">{status_counts.get('proc_failed', 0)}</div>
-                <div class="stat-label">İşleme Hatası</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number warning">{status_counts.get('duplicates', 0)}</div>
-                <div class="stat-label">Tekrarlanan</div>
-            </div>
-        </div>
-        
-        <div style="margin-top: 40px; text-align: center; color: #666; font-size: 0.9em;">
-            <p>Bu rapor Document Upload Manager tarafından otomatik olarak oluşturulmuştur.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+            with open(filepath, "wb") as f:
+                f.write(buf)
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(html_content)
             return True
         except Exception as e:
             print(f"HTML özet raporu oluşturulamadı: {e}")
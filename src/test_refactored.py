@@ -4,14 +4,25 @@ Test dosyası - Refactor edilmiş Document Upload Manager için.
 Bu dosya modüllerin doğru çalışıp çalışmadığını test eder.
 """
 
+import io
+import csv
 import sys
 import os
+import time
+import atexit
+import contextlib
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+from unittest.mock import MagicMock, patch
+import tkinter as tk
 
 # Test için gerekli modülleri import et
 try:
     from database import DatabaseManager
-    from file_manager import FileManager
+    from file_manager import FileManager, compute_file_info
     from api_client import APIClient
     from report_generator import ReportGenerator
     from modern_gui import ModernGUIComponents
@@ -23,51 +34,143 @@ except ImportError as e:
     print(f"❌ Import hatası: {e}")
     sys.exit(1)
 
+# Geçici test dosyaları için klasör; varsa RAM tabanlı /dev/shm kullanılır
+SCRATCH = Path(
+    os.environ.get(
+        "TEST_TMPDIR",
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    )
+)
 
-def test_database_manager():
-    """DatabaseManager'ı test et."""
-    print("\n🔍 DatabaseManager test ediliyor...")
-    try:
-        db = DatabaseManager("test_upload_logs.db")
+# Testlerde kullanılan sabit yapılandırma
+SUPPORTED = frozenset({".txt"})
+API_URL = "http://httpbin.org"
 
-        # Test verisi ekle
-        file_id = db.log_file_selection(
-            "test.pdf",
-            "test_hash_123",
-            1024,
-            "test_user",
-            "/original/path/test.pdf",
-            "/local/path/test.pdf",
-            False,
-        )
 
-        # Veriyi kontrol et
-        logs = db.get_filtered_logs({"status_filter": "Tümü"})
-        assert len(logs) > 0, "Log kaydı bulunamadı"
+# Süreç başına bir kez oluşturulan gizli Tk kökü
+_TK_ROOT = None
+
+
+def _tk_root():
+    """
+    Paylaşılan gizli Tk kökünü döndür.
+
+    Tcl yorumlayıcısı süreç başına bir kez başlatılır; Tk gerektiren testler
+    aynı kökü kullanır.
+
+    Returns:
+        Tk kökü; ekran yoksa None
+    """
+    global _TK_ROOT
+    if _TK_ROOT is None:
+        try:
+            _TK_ROOT = tk.Tk()
+        except tk.TclError:
+            return None
+        _TK_ROOT.withdraw()
+        atexit.register(_TK_ROOT.destroy)
+    return _TK_ROOT
+
+
+# Süreç başına bir kez oluşturulan paylaşılan test veritabanı
+_SHARED_DB = None
 
-        # Test veritabanını temizle
-        db.clear_logs()
 
-        print("✅ DatabaseManager test başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ DatabaseManager test hatası: {e}")
-        return False
+def _shared_db():
+    """
+    Paylaşılan bellek içi test veritabanını döndür.
+
+    Şema süreç başına bir kez oluşturulur; veritabanı kullanan testler aynı
+    işçide çalışır ve başlarken tabloyu temizler.
+
+    Returns:
+        Temizlenmiş DatabaseManager
+    """
+    global _SHARED_DB
+    if _SHARED_DB is None:
+        _SHARED_DB = DatabaseManager("file:test_db?mode=memory&cache=shared", uri=True)
+    _SHARED_DB.clear_logs()
+    return _SHARED_DB
+
+
+def test_database_manager():
+    """DatabaseManager'ı test et."""
+    print("\n🔍 DatabaseManager test ediliyor...")
+    db = _shared_db()
+
+    # Test verisi ekle
+    file_id = db.log_file_selection(
+        "test.pdf",
+        "test_hash_123",
+        1024,
+        "test_user",
+        "/original/path/test.pdf",
+        "/local/path/test.pdf",
+        False,
+    )
+
+    # Veriyi kontrol et
+    logs = db.get_filtered_logs({"status_filter": "Tümü"})
+    assert len(logs) > 0, "Log kaydı bulunamadı"
+
+    # Toplu kayıt testi
+    db.log_file_selection_many(
+        [
+            (
+                f"bulk_{i}.txt",
+                f"bulk_hash_{i}",
+                i,
+                "test_user",
+                f"/original/path/bulk_{i}.txt",
+                f"/local/path/bulk_{i}.txt",
+                False,
+            )
+            for i in range(3)
+        ]
+    )
+    logs = db.get_filtered_logs({"format_filter": ".txt"})
+    assert len(logs) == 3, "Toplu kayıt sayısı yanlış"
+
+    # Kolon seçimi testi
+    logs = db.get_filtered_logs({}, columns=("filename", "file_size"))
+    assert all(len(row) == 2 for row in logs), "Kolon seçimi yanlış"
+
+    # Sıralama ve limit testi
+    logs = db.get_filtered_logs(
+        {"format_filter": ".txt"},
+        columns=("file_size",),
+        order_by="file_size",
+        descending=False,
+        limit=2,
+    )
+    assert [row[0] for row in logs] == [0, 1], "Sıralama/limit yanlış"
+
+    # Özet istatistik testi
+    stats = db.get_summary_stats()
+    assert stats["total_files"] == len(db.get_filtered_logs({})), "Toplam yanlış"
+    assert sum(count for _, count in stats["daily_stats"]) > 0, "Günlük boş"
+    assert stats["daily_max"] == max(
+        count for _, count in stats["daily_stats"]
+    ), "Günlük maksimum yanlış"
+
+    # Test veritabanını temizle
+    db.clear_logs()
+
+    print("✅ DatabaseManager test başarılı")
 
 
 def test_file_manager():
     """FileManager'ı test et."""
     print("\n🔍 FileManager test ediliyor...")
-    try:
-        # Test klasörü oluştur
-        test_dir = Path("test_files")
-        test_dir.mkdir(exist_ok=True)
+    # Klasör, test başarısız olsa bile with bloğundan çıkarken silinir
+    with tempfile.TemporaryDirectory(prefix="fm_test_", dir=SCRATCH) as td:
+        test_dir = Path(td)
 
         # Test dosyası oluştur
         test_file = test_dir / "test.txt"
         test_file.write_text("Test content")
 
-        fm = FileManager(str(test_dir), {".txt"})
+        fm = FileManager(str(test_dir), SUPPORTED)
 
         # Dosya bilgilerini al
         filename, size, file_hash = fm.get_file_info(str(test_file))
@@ -79,105 +182,207 @@ def test_file_manager():
         formatted_size = fm.format_file_size(1024)
         assert "KB" in formatted_size, "Boyut formatı yanlış"
 
-        # Test klasörünü temizle
-        import shutil
-
-        shutil.rmtree(test_dir)
-
-        print("✅ FileManager test başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ FileManager test hatası: {e}")
-        return False
+    print("✅ FileManager test başarılı")
 
 
 def test_api_client():
     """APIClient'ı test et."""
     print("\n🔍 APIClient test ediliyor...")
-    try:
-        api = APIClient("http://httpbin.org", {".txt"})
+    with patch("api_client.requests") as requests_mock:
+        api = APIClient(API_URL, SUPPORTED)
 
-        # Bağlantı testi (gerçek API'ya bağlanmadan)
-        # Bu test sadece sınıfın oluşturulabildiğini kontrol eder
-        assert api.api_base_url == "http://httpbin.org", "API URL yanlış"
+        assert api.api_base_url == API_URL, "API URL yanlış"
         assert ".txt" in api.supported_formats, "Desteklenen formatlar yanlış"
+        assert not requests_mock.method_calls, "Beklenmeyen HTTP çağrısı"
 
-        print("✅ APIClient test başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ APIClient test hatası: {e}")
-        return False
+    print("✅ APIClient test başarılı")
 
 
 def test_report_generator():
     """ReportGenerator'ı test et."""
     print("\n🔍 ReportGenerator test ediliyor...")
-    try:
-        # Mock FileManager oluştur
-        class MockFileManager:
-            def format_file_size(self, size):
-                return f"{size} B"
-
-        rg = ReportGenerator(MockFileManager())
-
-        # Duration format testi
-        duration = rg.format_duration(65.5)
-        assert "1m" in duration, "Duration formatı yanlış"
 
-        duration_short = rg.format_duration(30.0)
-        assert "30.0s" in duration_short, "Kısa duration formatı yanlış"
+    class MockFileManager:
+        def format_file_size(self, size):
+            return f"{size} B"
+
+    rg = ReportGenerator(MockFileManager())
+
+    # Duration format testi
+    duration = rg.format_duration(65.5)
+    assert "1m" in duration, "Duration formatı yanlış"
+
+    duration_short = rg.format_duration(30.0)
+    assert "30.0s" in duration_short, "Kısa duration formatı yanlış"
+    assert rg.format_duration(59.96) == "1m 0.0s", "Yuvarlanan duration yanlış"
+
+    columns = ["filename", "file_size", "upload_status"]
+    rows = [("a<b>&", 10, "uploaded"), ("ok.txt", 20, "upload_failed")]
+
+    with tempfile.TemporaryDirectory(prefix="rg_test_", dir=SCRATCH) as td:
+        # Detay rapor: veriler üreteçten tek geçişte okunur
+        html_path = os.path.join(td, "detay.html")
+        assert rg.generate_detail_report(
+            columns, (row for row in rows), html_path
+        ), "HTML detay rapor oluşturulamadı"
+        html = Path(html_path).read_text(encoding="utf-8")
+        assert "<td>a&lt;b&gt;&amp;</td>" in html, "HTML kaçışı yanlış"
+        assert "a<b>&" not in html, "Kaçışsız hücre var"
+        assert "Toplam Kayıt Sayısı: 2" in html, "Kayıt sayısı yanlış"
+
+        csv_path = os.path.join(td, "detay.csv")
+        assert rg.generate_detail_report(
+            columns, (row for row in rows), csv_path
+        ), "CSV detay rapor oluşturulamadı"
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            assert list(csv.reader(f)) == [
+                columns,
+                ["a<b>&", "10", "uploaded"],
+                ["ok.txt", "20", "upload_failed"],
+            ], "CSV içeriği yanlış"
+
+        # Özet rapor: veritabanı istatistiklerinden
+        db = DatabaseManager(":memory:")
+        db.log_file_selection_many(
+            [
+                (f"s{i}.pdf", f"s_hash_{i}", 100, f"user_{i % 2}", "/o", "/l", False)
+                for i in range(3)
+            ]
+        )
+        stats = db.get_summary_stats()
+        summary_path = os.path.join(td, "ozet.html")
+        assert rg.generate_summary_report(
+            stats, summary_path
+        ), "Özet rapor oluşturulamadı"
+        assert os.path.exists(summary_path), "Özet rapor dosyası yok"
+        summary = Path(summary_path).read_text(encoding="utf-8")
+        assert '<div class="stat-number">3</div>' in summary, "Toplam dosya yanlış"
+        assert "(0/3 dosya)" in summary, "Başarı oranı satırı yanlış"
+        assert "<td>user_0</td>" in summary, "Kullanıcı satırı yok"
 
-        print("✅ ReportGenerator test başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ ReportGenerator test hatası: {e}")
-        return False
+    print("✅ ReportGenerator test başarılı")
 
 
 def test_thread_manager():
     """ThreadManager'ı test et."""
     print("\n🔍 ThreadManager test ediliyor...")
-    try:
-        import tkinter as tk
+    root = MagicMock()
+    root.after.side_effect = lambda _, cb, *args: cb(*args)
+
+    tm = ThreadManager(root)
+    done = threading.Event()
+    results = []
+
+    # Basit test fonksiyonu
+    def test_func():
+        return {"success": True, "result": "test"}
 
-        root = tk.Tk()
-        root.withdraw()  # Pencereyi gizle
+    def test_callback(result):
+        results.append(result)
+        done.set()
 
-        tm = ThreadManager(root)
+    tm.run_upload_thread(test_func, test_callback)
 
-        # Basit test fonksiyonu
-        def test_func():
-            return {"success": True, "result": "test"}
+    assert done.wait(timeout=5), "Callback çağrılmadı"
+    assert results[0]["success"], "Callback test başarısız"
 
-        def test_callback(result):
-            assert result["success"], "Callback test başarısız"
+    # CPU yoğun iş ayrı süreçte çalışır, sonuç aynı sözlük biçiminde döner
+    cpu_done = threading.Event()
+    cpu_results = []
 
-        # Thread testi (hızlı test için)
-        tm.run_upload_thread(test_func, test_callback)
+    def cpu_callback(result):
+        cpu_results.append(result)
+        cpu_done.set()
 
-        root.destroy()
+    with tempfile.TemporaryDirectory(prefix="tm_test_", dir=SCRATCH) as td:
+        cpu_file = Path(td) / "cpu.txt"
+        cpu_file.write_text("cpu")
 
-        print("✅ ThreadManager test başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ ThreadManager test hatası: {e}")
-        return False
+        tm.run_cpu_thread(compute_file_info, cpu_callback, str(cpu_file))
+        assert cpu_done.wait(timeout=30), "CPU callback çağrılmadı"
+        cpu_done.clear()
+
+        tm.run_cpu_thread(compute_file_info, cpu_callback, str(cpu_file) + ".yok")
+        assert cpu_done.wait(timeout=30), "CPU hata callback'i çağrılmadı"
+    tm.shutdown(wait=True)
+
+    assert cpu_results[0]["success"], "CPU işi başarısız"
+    assert cpu_results[0]["result"][:2] == ("cpu.txt", 3), "CPU sonucu yanlış"
+    assert not cpu_results[1]["success"], "CPU hatası bildirilmedi"
+
+    # Hata veren callback, aynı boşaltmadaki diğer callback'leri engellememeli
+    scheduled = []
+    queued_root = MagicMock()
+    queued_root.after.side_effect = lambda _, cb, *args: scheduled.append((cb, args))
+    tm = ThreadManager(queued_root)
+    delivered = []
+
+    def failing_callback(result):
+        raise ValueError("callback hatası")
+
+    tm.run_upload_thread(lambda: 1, failing_callback)
+    tm.run_upload_thread(lambda: 2, delivered.append)
+
+    # İki iş de bitip kuyruğa girene kadar bekle; boşaltma bir kez zamanlanır
+    deadline = time.monotonic() + 5
+    while (
+        len(scheduled) < 1 or tm._completed.qsize() < 2
+    ) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(scheduled) == 1, "Boşaltma bir kez zamanlanmalı"
+
+    for cb, args in scheduled:
+        cb(*args)
+    tm.shutdown(wait=True)
+
+    assert delivered == [2], "Hatalı callback sonrası kuyruk takıldı"
+    assert queued_root.report_callback_exception.call_count == 1, "Hata bildirilmedi"
+
+    print("✅ ThreadManager test başarılı")
+
+
+def test_thread_manager_tk():
+    """ThreadManager'ı gerçek Tk olay döngüsüyle test et."""
+    print("\n🔍 ThreadManager (Tk) test ediliyor...")
+    root = _tk_root()
+    if root is None:
+        print("⏭️  ThreadManager (Tk) testi atlandı: ekran yok")
+        return
+
+    tm = ThreadManager(root)
+    results = []
+
+    def slow_job():
+        # İş, done callback'i kaydedildikten sonra işçi thread'de biter
+        time.sleep(0.05)
+        return {"success": True}
+
+    def on_result(result):
+        results.append(result)
+        root.quit()
+
+    # after() işçi thread'den çağrıldığı için gerçek olay döngüsü çalışmalı
+    timeout_id = root.after(5000, root.quit)
+    tm.run_upload_thread(slow_job, on_result)
+    root.mainloop()
+    root.after_cancel(timeout_id)
+    tm.shutdown(wait=True)
+
+    assert results and results[0]["success"], "Tk callback çağrılmadı"
+
+    print("✅ ThreadManager (Tk) test başarılı")
 
 
 def test_integration():
     """Entegrasyon testi."""
     print("\n🔍 Entegrasyon testi yapılıyor...")
-    try:
-        # Tüm modülleri birlikte test et
-        db = DatabaseManager("test_integration.db")
-        fm = FileManager("test_integration_files", {".txt"})
-        api = APIClient("http://httpbin.org", {".txt"})
+    with tempfile.TemporaryDirectory(prefix="integration_test_", dir=SCRATCH) as td:
+        test_dir = Path(td)
+        db = _shared_db()
+        fm = FileManager(str(test_dir), SUPPORTED)
+        api = APIClient(API_URL, SUPPORTED)
         rg = ReportGenerator(fm)
 
-        # Test klasörü oluştur
-        test_dir = Path("test_integration_files")
-        test_dir.mkdir(exist_ok=True)
-
         # Test dosyası oluştur
         test_file = test_dir / "integration_test.txt"
         test_file.write_text("Integration test content")
@@ -200,52 +405,123 @@ def test_integration():
         logs = db.get_filtered_logs({"status_filter": "Tümü"})
         assert len(logs) > 0, "Entegrasyon testi başarısız"
 
-        # Temizlik
-        db.clear_logs()
-        import shutil
-
-        shutil.rmtree(test_dir)
-        os.remove("test_integration.db")
-
-        print("✅ Entegrasyon testi başarılı")
-        return True
-    except Exception as e:
-        print(f"❌ Entegrasyon testi hatası: {e}")
-        return False
-
-
-def main():
-    """Ana test fonksiyonu."""
-    print("🚀 Document Upload Manager - Refactor Test Suite")
-    print("=" * 50)
-
-    tests = [
-        test_database_manager,
-        test_file_manager,
-        test_api_client,
-        test_report_generator,
-        test_thread_manager,
-        test_integration,
+        # Toplu kayıt: 1000 satır tek transaction'da
+        db.log_file_selection_many(
+            [
+                (
+                    f"f{i}.pdf",
+                    f"hash_{i}",
+                    i,
+                    "integration_test_user",
+                    f"/original/f{i}.pdf",
+                    f"/local/f{i}.pdf",
+                    False,
+                )
+                for i in range(1000)
+            ]
+        )
+        logs = db.get_filtered_logs({"format_filter": ".pdf"}, columns=("filename",))
+        assert len(logs) == 1000, "Toplu kayıt sayısı yanlış"
+
+    # Temizlik
+    db.clear_logs()
+
+    print("✅ Entegrasyon testi başarılı")
+
+
+def _run_one(test: Callable[[], None]) -> Tuple[str, bool, str]:
+    """
+    Tek bir testi çalıştır (işçi süreçte).
+
+    Test başarısızlığı assert ile bildirir; yakalanan her hata testi başarısız
+    sayar. Testin çıktısı bellekte toplanır ve ana sürece tek parça olarak döner.
+
+    Args:
+        test: Test fonksiyonu
+
+    Returns:
+        (test adı, başarılı mı, test çıktısı) üçlüsü
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            test()
+            success = True
+        except Exception as e:
+            print(f"❌ {test.__name__} hatası: {type(e).__name__}: {e}")
+            success = False
+    return test.__name__, success, buffer.getvalue()
+
+
+def _run_group(group: Sequence[Callable[[], None]]) -> List[Tuple[str, bool, str]]:
+    """
+    Bir test grubunu aynı işçi süreçte sırayla çalıştır.
+
+    Args:
+        group: Test fonksiyonları
+
+    Returns:
+        Her test için _run_one sonucu
+    """
+    return [_run_one(test) for test in group]
+
+
+def main(fail_fast: bool = False):
+    """
+    Ana test fonksiyonu.
+
+    Test grupları ayrı süreçlerde paralel çalıştırılır; her test kendi
+    geçici klasörünü kullanır. Veritabanı testleri aynı grupta olduğundan
+    tek bir paylaşılan veritabanını kullanır.
+    Tüm çıktı biriktirilir ve sonda tek seferde yazılır.
+
+    Args:
+        fail_fast: İlk başarısız testte kalan testler beklenmeden durulsun mu
+    """
+    groups = [
+        (test_database_manager, test_integration),
+        (test_file_manager,),
+        (test_api_client,),
+        (test_report_generator,),
+        (test_thread_manager,),
+        (test_thread_manager_tk,),
     ]
 
+    total = sum(len(group) for group in groups)
     passed = 0
-    total = len(tests)
-
-    for test in tests:
-        if test():
-            passed += 1
-
-    print("\n" + "=" * 50)
-    print(f"📊 Test Sonuçları: {passed}/{total} test başarılı")
-
-    if passed == total:
-        print("🎉 Tüm testler başarılı! Refactor işlemi başarılı.")
-        return True
-    else:
-        print("⚠️  Bazı testler başarısız. Lütfen hataları kontrol edin.")
-        return False
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output):
+        print("🚀 Document Upload Manager - Refactor Test Suite")
+        print("=" * 50)
+
+        # ProcessPoolExecutor işçileri daemon değildir; run_cpu_thread testi
+        # kendi süreç havuzunu açabilir
+        with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+            results = (
+                result for group in pool.map(_run_group, groups) for result in group
+            )
+            for _, success, test_output in results:
+                print(test_output, end="")
+                if success:
+                    passed += 1
+                elif fail_fast:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
+
+        print("\n" + "=" * 50)
+        print(f"📊 Test Sonuçları: {passed}/{total} test başarılı")
+
+        if passed == total:
+            print("🎉 Tüm testler başarılı! Refactor işlemi başarılı.")
+        else:
+            print("⚠️  Bazı testler başarısız. Lütfen hataları kontrol edin.")
+
+    sys.stdout.write(output.getvalue())
+    sys.stdout.flush()
+    return passed == total
 
 
 if __name__ == "__main__":
-    success = main()
+    success = main(fail_fast="--fail-fast" in sys.argv[1:])
     sys.exit(0 if success else 1)
@@ -4,11 +4,29 @@ Threading işlemleri için modül.
 Bu modül arka plan işlemlerini yönetir.
 """
 
+import os
+import sys
+import queue
 import threading
-from typing import Callable, Any, Dict, Optional
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Any, Dict, List, Optional
 from tkinter import messagebox
 
 
+def _run_cpu_job(func: Callable, *args: Any) -> Dict[str, Any]:
+    """
+    Süreç havuzunda fonksiyonu çalıştır ve sonucu callback biçimine sar.
+
+    Args:
+        func: Modül seviyesinde tanımlı fonksiyon
+        *args: Fonksiyona verilecek argümanlar
+
+    Returns:
+        {"success": True, "result": sonuç} sözlüğü
+    """
+    return {"success": True, "result": func(*args)}
+
+
 class ThreadManager:
     """Threading işlemlerini yöneten sınıf."""
 
@@ -22,26 +40,136 @@ class ThreadManager:
         """
         self.root = root
         self.gui = gui_components
+        # İşler her çağrıda yeni thread açmak yerine kalıcı işçilere verilir.
+        # İşçiler daemon'dur: pencere kapanınca süren API çağrıları beklenmez.
+        self._max_workers = os.cpu_count() or 4
+        self._jobs: queue.Queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+        self._closed = False
+        # CPU yoğun işler için süreç havuzu; ilk kullanımda oluşturulur
+        self._proc_pool: Optional[ProcessPoolExecutor] = None
+        # Biten işlerin callback'leri kuyrukta toplanır ve tek bir
+        # root.after ile ana thread'de topluca çalıştırılır
+        self._completed: queue.SimpleQueue = queue.SimpleQueue()
+        self._drain_lock = threading.Lock()
+        self._drain_pending = False
 
-    def run_upload_thread(self, upload_func: Callable, callback: Callable) -> None:
+    def _enqueue(self, func: Callable, *args: Any) -> Future:
         """
-        Upload işlemini thread'de çalıştır.
+        Fonksiyonu daemon işçi kuyruğuna ekle.
 
         Args:
-            upload_func: Upload fonksiyonu
+            func: Arka planda çalışacak fonksiyon
+            *args: Fonksiyona verilecek argümanlar
+
+        Returns:
+            İşin Future nesnesi
+        """
+        future = Future()
+        with self._workers_lock:
+            if self._closed:
+                raise RuntimeError("ThreadManager kapatıldı")
+            self._jobs.put((future, func, args))
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._worker,
+                    name=f"upload_{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def _worker(self) -> None:
+        """Kuyruktaki işleri sırayla çalıştır; None gelince dur."""
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                return
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _submit(
+        self,
+        func: Callable,
+        callback: Callable,
+        *args: Any,
+        pool: Optional[Executor] = None,
+    ) -> Future:
+        """
+        Fonksiyonu havuzda çalıştır, sonucu ana thread'de callback'e ver.
+
+        Args:
+            func: Arka planda çalışacak fonksiyon
             callback: Tamamlandığında çağrılacak callback
+            *args: Fonksiyona verilecek argümanlar
+            pool: Kullanılacak havuz; verilmezse daemon işçiler
+
+        Returns:
+            İşin Future nesnesi
         """
 
-        def thread_worker():
+        def on_done(future: Future) -> None:
+            # Kapanışta iptal edilen işler için callback çağrılmaz
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is None:
+                result = future.result()
+            else:
+                result = {"success": False, "error": str(error)}
+            self._completed.put((callback, result))
+            with self._drain_lock:
+                if self._drain_pending:
+                    return
+                self._drain_pending = True
+            try:
+                self.root.after(0, self._drain_completed)
+            except Exception:
+                # Zamanlanamazsa bayrak bırakılır, sonraki işler yeniden dener
+                with self._drain_lock:
+                    self._drain_pending = False
+                raise
+
+        if pool is None:
+            future = self._enqueue(func, *args)
+        else:
+            future = pool.submit(func, *args)
+        future.add_done_callback(on_done)
+        return future
+
+    def _drain_completed(self) -> None:
+        """Kuyruktaki tamamlanmış işlerin callback'lerini çalıştır (ana thread)."""
+        with self._drain_lock:
+            self._drain_pending = False
+        while True:
+            try:
+                callback, result = self._completed.get_nowait()
+            except queue.Empty:
+                return
+            # Hatalı bir callback kuyruktaki diğerlerini engellemez
             try:
-                result = upload_func()
-                self.root.after(0, callback, result)
-            except Exception as e:
-                self.root.after(0, callback, {"success": False, "error": str(e)})
+                callback(result)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
 
-        thread = threading.Thread(target=thread_worker)
-        thread.daemon = True
-        thread.start()
+    def run_upload_thread(self, upload_func: Callable, callback: Callable) -> None:
+        """
+        Upload işlemini thread'de çalıştır.
+
+        Args:
+            upload_func: Upload fonksiyonu
+            callback: Tamamlandığında çağrılacak callback
+        """
+        self._submit(upload_func, callback)
 
     def run_process_thread(self, process_func: Callable, callback: Callable) -> None:
         """
@@ -51,14 +179,51 @@ class ThreadManager:
             process_func: Process fonksiyonu
             callback: Tamamlandığında çağrılacak callback
         """
+        self._submit(process_func, callback)
 
-        def thread_worker():
-            try:
-                result = process_func()
-                self.root.after(0, callback, result)
-            except Exception as e:
-                self.root.after(0, callback, {"success": False, "error": str(e)})
-
-        thread = threading.Thread(target=thread_worker)
-        thread.daemon = True
-        thread.start()
+    def run_cpu_thread(self, func: Callable, callback: Callable, *args: Any) -> None:
+        """
+        CPU yoğun işlemi ayrı bir süreçte çalıştır.
+
+        Hash hesaplama gibi işler GIL'e takılmadan birden fazla çekirdekte
+        çalışır. Fonksiyon ve argümanlar pickle edilebilir olmalıdır
+        (ör. file_manager.compute_file_info gibi modül seviyesinde fonksiyonlar).
+        Callback başarıda {"success": True, "result": ...}, hatada
+        {"success": False, "error": ...} alır.
+
+        Args:
+            func: Modül seviyesinde tanımlı fonksiyon
+            callback: Tamamlandığında çağrılacak callback
+            *args: Fonksiyona verilecek argümanlar
+        """
+        if self._proc_pool is None:
+            # İşçi sayısı verilmez; Windows'taki üst sınırı havuz kendisi uygular
+            self._proc_pool = ProcessPoolExecutor()
+        self._submit(_run_cpu_job, callback, func, *args, pool=self._proc_pool)
+
+    def shutdown(self, wait: bool = False, cancel_futures: bool = False) -> None:
+        """
+        İşçileri ve süreç havuzunu kapat.
+
+        Args:
+            wait: Çalışan işlerin bitmesi beklensin mi
+            cancel_futures: Henüz başlamamış işler iptal edilsin mi
+        """
+        with self._workers_lock:
+            self._closed = True
+            workers = list(self._workers)
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in workers:
+            self._jobs.put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
+        if self._proc_pool is not None:
+            self._proc_pool.shutdown(wait=wait, cancel_futures=cancel_futures)